@@ -40,9 +40,6 @@ class AppDelegate: NSObject, NSApplicationDelegate {
             print("Failed to initialize database")
         }
         
-        // Initialize activity store
-        let activityStore = ActivityStore.shared
-        
         // Create main content view
         let contentView = TabNavigator()
             .environmentObject(WindowManager.shared)
@@ -72,9 +69,11 @@ class AppDelegate: NSObject, NSApplicationDelegate {
             let screenshotsDir = AppSettings.shared.screenshotsDirectory
             ScreenshotScanner.shared.startMonitoring(directory: screenshotsDir)
             
-            // Start activity monitoring if enabled
+            // Start activity monitoring if enabled; when logging is off the store and its
+            // monitors are only created on first use (the context graph still loads at
+            // launch through the context exporter and API server)
             if AppSettings.shared.activityLoggingEnabled {
-                activityStore.startMonitoring()
+                ActivityStore.shared.startMonitoring()
             }
             
             // Start memory tracking for agent intelligence
@@ -113,7 +112,9 @@ class AppDelegate: NSObject, NSApplicationDelegate {
         // Cleanup
         ClipboardMonitor.shared.stopMonitoring()
         ScreenshotScanner.shared.stopMonitoring()
-        ActivityStore.shared.stopMonitoring()
+        if AppSettings.shared.activityLoggingEnabled {
+            ActivityStore.shared.stopMonitoring()
+        }
         contextExporter.stopAutoExport()
         contextAPIServer.stop()
         hotkeyManager.unregister()
@@ -15,6 +15,19 @@ class Database {
     private let dbPath: String
     private let dbQueue = DispatchQueue(label: "com.solunified.database", qos: .utility)
     
+    // Prepared DML statements keyed by SQL text; only touched on dbQueue
+    private struct CachedStatement {
+        let handle: OpaquePointer
+        var lastUsed: UInt64
+    }
+    
+    private var statementCache: [String: CachedStatement] = [:]
+    private var statementClock: UInt64 = 0  // bumped on every cache touch; lowest lastUsed is evicted
+    private static let maxCachedStatements = 64
+    
+    /// Whether screenshots_fts was created; FTS5's trigram tokenizer needs SQLite 3.34+
+    private(set) var hasScreenshotSearchIndex = false
+    
     private init() {
         let fileManager = FileManager.default
         let appSupport = fileManager.urls(for: .applicationSupportDirectory, in: .userDomainMask).first!
@@ -41,6 +54,17 @@ class Database {
                 print("Warning: Failed to enable WAL mode")
             }
             
+            // WAL makes NORMAL sync durable across app crashes; keep temp data and hot pages in memory
+            let tuning = [
+                "PRAGMA synchronous=NORMAL;",
+                "PRAGMA temp_store=MEMORY;",
+                "PRAGMA cache_size=-16000;",
+                "PRAGMA mmap_size=268435456;"
+            ]
+            for pragma in tuning where !executeSync(pragma) {
+                print("Warning: Failed to apply \(pragma)")
+            }
+            
             // Create base tables first (without indexes that depend on columns that might not exist)
             result = createBaseTablesSync()
             
@@ -52,6 +76,7 @@ class Database {
             // Now create indexes (columns should exist after migrations)
             if result {
                 createIndexesSync()
+                createScreenshotSearchIndexSync()
             }
         }
         return result
@@ -66,7 +91,7 @@ class Database {
         if !hasSequenceId {
             print("Migrating: Adding sequence_id to activity_log")
             if executeSync("ALTER TABLE activity_log ADD COLUMN sequence_id TEXT") {
-                _ = executeSync("CREATE INDEX IF NOT EXISTS idx_activity_sequence ON activity_log(sequence_id)")
+                _ = executeSync("CREATE INDEX IF NOT EXISTS idx_activity_sequence_timestamp ON activity_log(sequence_id, timestamp)")
             } else {
                 print("Error adding sequence_id column")
             }
@@ -228,6 +253,8 @@ class Database {
         _ = executeSync("CREATE INDEX IF NOT EXISTS idx_memories_category ON memories(category)")
         _ = executeSync("CREATE INDEX IF NOT EXISTS idx_memories_key ON memories(key)")
         _ = executeSync("CREATE UNIQUE INDEX IF NOT EXISTS idx_memories_category_key ON memories(category, key)")
+        // Matches the load and search ORDER BY, so neither needs a sort step
+        _ = executeSync("CREATE INDEX IF NOT EXISTS idx_memories_usage ON memories(usage_count DESC, updated_at DESC)")
 
         // Migration: Create conversations table
         _ = executeSync("""
@@ -256,8 +283,8 @@ class Database {
                 FOREIGN KEY (conversation_id) REFERENCES conversations(id)
             )
         """)
-        _ = executeSync("CREATE INDEX IF NOT EXISTS idx_chat_messages_conversation ON chat_messages(conversation_id)")
         _ = executeSync("CREATE INDEX IF NOT EXISTS idx_chat_messages_timestamp ON chat_messages(timestamp)")
+        _ = executeSync("CREATE INDEX IF NOT EXISTS idx_chat_messages_conversation_timestamp ON chat_messages(conversation_id, timestamp)")
 
         // Migration: Create agent_actions table
         _ = executeSync("""
@@ -508,8 +535,9 @@ class Database {
             "CREATE INDEX IF NOT EXISTS idx_screenshots_created ON screenshots(created_at DESC)",
             "CREATE INDEX IF NOT EXISTS idx_activity_timestamp ON activity_log(timestamp DESC)",
             "CREATE INDEX IF NOT EXISTS idx_activity_type ON activity_log(event_type)",
-            "CREATE INDEX IF NOT EXISTS idx_activity_app ON activity_log(app_bundle_id)",
-            "CREATE INDEX IF NOT EXISTS idx_activity_sequence ON activity_log(sequence_id)",
+            // Equality column first, then time, so per-app and per-sequence lookups read in timestamp order
+            "CREATE INDEX IF NOT EXISTS idx_activity_app_timestamp ON activity_log(app_bundle_id, timestamp)",
+            "CREATE INDEX IF NOT EXISTS idx_activity_sequence_timestamp ON activity_log(sequence_id, timestamp)",
             "CREATE INDEX IF NOT EXISTS idx_sequences_start ON sequences(start_time DESC)",
             "CREATE INDEX IF NOT EXISTS idx_neural_timestamp ON neural_values(timestamp DESC)"
         ]
@@ -520,6 +548,85 @@ class Database {
                 // Don't fail on index creation - just log warning
             }
         }
+        
+        // Single-column indexes that are now a prefix of a composite one; they only cost writes
+        let superseded = [
+            "DROP INDEX IF EXISTS idx_activity_app",
+            "DROP INDEX IF EXISTS idx_activity_sequence",
+            "DROP INDEX IF EXISTS idx_chat_messages_conversation"
+        ]
+        for sql in superseded where !executeSync(sql) {
+            print("Warning: Failed to drop index: \(sql)")
+        }
+    }
+    
+    /// Full-text index over the searchable screenshot columns. The trigram tokenizer matches
+    /// substrings case-insensitively, the same results LIKE '%term%' gave, without a table scan
+    private func createScreenshotSearchIndexSync() {
+        let existing = querySync("SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'screenshots_fts'")
+        let isNew = existing.isEmpty
+        
+        if isNew {
+            let created = executeSync("""
+                CREATE VIRTUAL TABLE screenshots_fts USING fts5(
+                    ai_description, ai_tags, ai_text_content, filename, source_app_name, source_window_title,
+                    content='screenshots', content_rowid='id', tokenize='trigram'
+                )
+            """)
+            guard created else {
+                print("Warning: Full-text search unavailable, screenshot search will scan")
+                return
+            }
+        }
+        
+        // Keep the index in step with the content table
+        let triggers = [
+            """
+            CREATE TRIGGER IF NOT EXISTS screenshots_fts_ai AFTER INSERT ON screenshots BEGIN
+                INSERT INTO screenshots_fts(rowid, ai_description, ai_tags, ai_text_content, filename, source_app_name, source_window_title)
+                VALUES (new.id, new.ai_description, new.ai_tags, new.ai_text_content, new.filename, new.source_app_name, new.source_window_title);
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS screenshots_fts_ad AFTER DELETE ON screenshots BEGIN
+                INSERT INTO screenshots_fts(screenshots_fts, rowid, ai_description, ai_tags, ai_text_content, filename, source_app_name, source_window_title)
+                VALUES ('delete', old.id, old.ai_description, old.ai_tags, old.ai_text_content, old.filename, old.source_app_name, old.source_window_title);
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS screenshots_fts_au AFTER UPDATE ON screenshots BEGIN
+                INSERT INTO screenshots_fts(screenshots_fts, rowid, ai_description, ai_tags, ai_text_content, filename, source_app_name, source_window_title)
+                VALUES ('delete', old.id, old.ai_description, old.ai_tags, old.ai_text_content, old.filename, old.source_app_name, old.source_window_title);
+                INSERT INTO screenshots_fts(rowid, ai_description, ai_tags, ai_text_content, filename, source_app_name, source_window_title)
+                VALUES (new.id, new.ai_description, new.ai_tags, new.ai_text_content, new.filename, new.source_app_name, new.source_window_title);
+            END
+            """
+        ]
+        var ready = triggers.allSatisfy { executeSync($0) }
+        
+        // Index rows that existed before the table did
+        if ready && isNew {
+            ready = executeSync("INSERT INTO screenshots_fts(screenshots_fts) VALUES ('rebuild')")
+        }
+        
+        guard ready else {
+            // Drop a half-built index so the next launch starts over instead of trusting it
+            print("Warning: Failed to build screenshot search index")
+            if isNew {
+                for name in ["screenshots_fts_ai", "screenshots_fts_ad", "screenshots_fts_au"] {
+                    _ = executeSync("DROP TRIGGER IF EXISTS \(name)")
+                }
+                _ = executeSync("DROP TABLE IF EXISTS screenshots_fts")
+            }
+            return
+        }
+        
+        hasScreenshotSearchIndex = true
+    }
+    
+    /// Quotes user text as a single FTS5 phrase so operators and punctuation match literally
+    static func ftsPhrase(_ text: String) -> String {
+        return "\"" + text.replacingOccurrences(of: "\"", with: "\"\"") + "\""
     }
     
     @discardableResult
@@ -531,10 +638,35 @@ class Database {
         return result
     }
     
-    private func executeSync(_ sql: String, parameters: [Any] = []) -> Bool {
-        var statement: OpaquePointer?
+    /// Runs the statements in order inside one transaction (a single commit and WAL sync);
+    /// if any statement fails the whole batch is rolled back
+    @discardableResult
+    func executeBatch(_ statements: [(sql: String, parameters: [Any])]) -> Bool {
+        guard !statements.isEmpty else { return true }
         
-        guard sqlite3_prepare_v2(db, sql, -1, &statement, nil) == SQLITE_OK else {
+        var result: Bool = false
+        dbQueue.sync {
+            guard self.beginTransactionSync() else {
+                print("Failed to begin transaction for batch")
+                return
+            }
+            
+            for statement in statements where !self.executeSync(statement.sql, parameters: statement.parameters) {
+                print("Error executing batch statement: \(String(cString: sqlite3_errmsg(self.db)))")
+                _ = self.rollbackTransactionSync()
+                return
+            }
+            
+            result = self.commitTransactionSync()
+            if !result {
+                _ = self.rollbackTransactionSync()
+            }
+        }
+        return result
+    }
+    
+    private func executeSync(_ sql: String, parameters: [Any] = []) -> Bool {
+        guard let statement = prepareStatementSync(sql) else {
             print("Error preparing statement: \(String(cString: sqlite3_errmsg(db)))")
             return false
         }
@@ -554,7 +686,7 @@ class Database {
         }
         
         let stepResult = sqlite3_step(statement)
-        sqlite3_finalize(statement)
+        releaseStatementSync(statement, sql: sql)
         
         return stepResult == SQLITE_DONE || stepResult == SQLITE_ROW
     }
@@ -568,10 +700,9 @@ class Database {
     }
     
     private func querySync(_ sql: String, parameters: [Any] = []) -> [[String: Any]] {
-        var statement: OpaquePointer?
         var results: [[String: Any]] = []
         
-        guard sqlite3_prepare_v2(db, sql, -1, &statement, nil) == SQLITE_OK else {
+        guard let statement = prepareStatementSync(sql) else {
             print("Error preparing query: \(String(cString: sqlite3_errmsg(db)))")
             return results
         }
@@ -616,10 +747,58 @@ class Database {
             results.append(row)
         }
         
-        sqlite3_finalize(statement)
+        releaseStatementSync(statement, sql: sql)
         return results
     }
     
+    // MARK: - Statement Cache
+    
+    /// Returns a cached prepared statement for hot DML, or prepares a fresh one
+    private func prepareStatementSync(_ sql: String) -> OpaquePointer? {
+        if var cached = statementCache[sql] {
+            statementClock += 1
+            cached.lastUsed = statementClock
+            statementCache[sql] = cached
+            return cached.handle
+        }
+        
+        var statement: OpaquePointer?
+        guard sqlite3_prepare_v2(db, sql, -1, &statement, nil) == SQLITE_OK else {
+            sqlite3_finalize(statement)
+            return nil
+        }
+        return statement
+    }
+    
+    /// Resets and keeps cacheable statements for reuse; finalizes everything else.
+    /// A full cache evicts (and finalizes) its least recently used statement.
+    private func releaseStatementSync(_ statement: OpaquePointer, sql: String) {
+        let isCached = statementCache[sql] != nil
+        guard isCached || Database.isCacheable(sql) else {
+            sqlite3_finalize(statement)
+            return
+        }
+        
+        sqlite3_reset(statement)
+        sqlite3_clear_bindings(statement)
+        guard !isCached else { return }
+        
+        if statementCache.count >= Database.maxCachedStatements,
+           let oldest = statementCache.min(by: { $0.value.lastUsed < $1.value.lastUsed }) {
+            sqlite3_finalize(oldest.value.handle)
+            statementCache.removeValue(forKey: oldest.key)
+        }
+        
+        statementClock += 1
+        statementCache[sql] = CachedStatement(handle: statement, lastUsed: statementClock)
+    }
+    
+    /// Only plain DML is worth keeping; DDL and PRAGMAs run once at startup
+    private static func isCacheable(_ sql: String) -> Bool {
+        let keyword = sql.drop(while: { $0.isWhitespace }).prefix(6).uppercased()
+        return ["SELECT", "INSERT", "UPDATE", "DELETE"].contains(keyword)
+    }
+    
     func lastInsertRowId() -> Int {
         var rowId: Int = 0
         dbQueue.sync {
@@ -651,15 +830,19 @@ class Database {
             VALUES (?, ?, ?, ?, ?, ?, ?, ?)
             """
         
+        // Prepare once and rebind per row instead of re-parsing the INSERT for every event
+        var statement: OpaquePointer?
+        guard sqlite3_prepare_v2(db, sql, -1, &statement, nil) == SQLITE_OK else {
+            print("Error preparing activity event insert: \(String(cString: sqlite3_errmsg(db)))")
+            sqlite3_finalize(statement)
+            _ = rollbackTransactionSync()
+            return false
+        }
+        
         var success = true
         for event in events {
-            var statement: OpaquePointer?
-            
-            guard sqlite3_prepare_v2(db, sql, -1, &statement, nil) == SQLITE_OK else {
-                print("Error preparing activity event insert: \(String(cString: sqlite3_errmsg(db)))")
-                success = false
-                break
-            }
+            sqlite3_reset(statement)
+            sqlite3_clear_bindings(statement)
             
             // Bind parameters
             sqlite3_bind_text(statement, 1, (event.eventType.rawValue as NSString).utf8String, -1, nil)
@@ -700,15 +883,12 @@ class Database {
             if sqlite3_step(statement) != SQLITE_DONE {
                 print("Error inserting activity event: \(String(cString: sqlite3_errmsg(db)))")
                 success = false
-            }
-            
-            sqlite3_finalize(statement)
-            
-            if !success {
                 break
             }
         }
         
+        sqlite3_finalize(statement)
+        
         if success {
             if !commitTransactionSync() {
                 print("Failed to commit transaction for activity events")
@@ -806,6 +986,9 @@ class Database {
     }
     
     deinit {
+        for cached in statementCache.values {
+            sqlite3_finalize(cached.handle)
+        }
         if db != nil {
             sqlite3_close(db)
         }
@@ -814,14 +997,14 @@ class Database {
 
 // MARK: - Date Helpers
 extension Database {
+    /// Shared formatter; ISO8601DateFormatter is thread-safe and costly to create per row
+    static let iso8601Formatter = ISO8601DateFormatter()
+    
     static func dateToString(_ date: Date) -> String {
-        let formatter = ISO8601DateFormatter()
-        return formatter.string(from: date)
+        return iso8601Formatter.string(from: date)
     }
     
     static func stringToDate(_ string: String) -> Date? {
-        let formatter = ISO8601DateFormatter()
-        return formatter.date(from: string)
+        return iso8601Formatter.date(from: string)
     }
 }
-
@@ -13,6 +13,7 @@ class ActivityMonitor {
     static let shared = ActivityMonitor()
     
     private var observers: [NSObjectProtocol] = []
+    private let ownBundleId = Bundle.main.bundleIdentifier
     private var windowTitleTimer: Timer?
     private var lastWindowTitle: String?
     private var lastWindowTitleTime: Date?
@@ -32,6 +33,11 @@ class ActivityMonitor {
     // Event sequence tracking
     private var eventSequence: [(type: String, timestamp: Date, app: String?, window: String?)] = []
     private let maxSequenceLength = 100
+
+    // Accessibility trust rarely changes, but window polling asks several times a second
+    private var accessibilityTrusted = false
+    private var accessibilityCheckedAt: Date = .distantPast
+    private let accessibilityCheckInterval: TimeInterval = 30
     
     var onAppLaunch: ((NSRunningApplication) -> Void)?
     var onAppTerminate: ((NSRunningApplication) -> Void)?
@@ -224,7 +230,7 @@ class ActivityMonitor {
     }
     
     private func getAllWindows() -> [String] {
-        guard AXIsProcessTrusted() else { return [] }
+        guard isAccessibilityTrusted() else { return [] }
         
         var windows: [String] = []
         
@@ -264,18 +270,26 @@ class ActivityMonitor {
         return windows
     }
     
+    /// Accessibility trust status, re-checked at most once per `accessibilityCheckInterval`
+    private func isAccessibilityTrusted() -> Bool {
+        let now = Date()
+        if now.timeIntervalSince(accessibilityCheckedAt) < accessibilityCheckInterval {
+            return accessibilityTrusted
+        }
+        accessibilityTrusted = AXIsProcessTrusted()
+        accessibilityCheckedAt = now
+        return accessibilityTrusted
+    }
+
     func getActiveWindowTitle() -> String? {
         // Check Accessibility permission
-        let options = [kAXTrustedCheckOptionPrompt.takeUnretainedValue() as String: false]
-        let accessEnabled = AXIsProcessTrustedWithOptions(options as CFDictionary)
-        
-        guard accessEnabled else {
+        guard isAccessibilityTrusted() else {
             return nil
         }
         
         // Skip tracking Sol Unified's own window
         if let frontmostApp = NSWorkspace.shared.frontmostApplication,
-           frontmostApp.bundleIdentifier == Bundle.main.bundleIdentifier {
+           frontmostApp.bundleIdentifier == ownBundleId {
             return nil
         }
         
@@ -432,18 +446,19 @@ class ActivityMonitor {
         return nil
     }
     
+    private static let browserBundleIds: Set<String> = [
+        "com.apple.Safari",
+        "com.google.Chrome",
+        "com.brave.Browser",
+        "org.mozilla.firefox",
+        "com.microsoft.edgemac",
+        "com.operasoftware.Opera",
+        "company.thebrowser.Browser" // Arc
+    ]
+
     private func isBrowserApp(_ bundleId: String?) -> Bool {
         guard let bundleId = bundleId else { return false }
-        let browsers = [
-            "com.apple.Safari",
-            "com.google.Chrome",
-            "com.brave.Browser",
-            "org.mozilla.firefox",
-            "com.microsoft.edgemac",
-            "com.operasoftware.Opera",
-            "company.thebrowser.Browser" // Arc
-        ]
-        return browsers.contains(bundleId)
+        return Self.browserBundleIds.contains(bundleId)
     }
     
     // MARK: - Document Path Extraction
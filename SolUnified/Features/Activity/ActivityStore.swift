@@ -57,6 +57,7 @@ class ActivityStore: ObservableObject {
     private let inputMonitor = InputMonitor.shared
     private let internalTracker = InternalAppTracker.shared
     private let contextGraph = ContextGraphManager.shared
+    private let ownBundleId = Bundle.main.bundleIdentifier
     
     private var eventBuffer: [ActivityEvent] = []
     private let bufferSize = 50
@@ -515,8 +516,10 @@ class ActivityStore: ObservableObject {
         logDataCaptureEvent(type: .reflectionLog, payload: payload)
     }
     
+    private static let payloadEncoder = JSONEncoder()
+    
     private func logDataCaptureEvent<T: Encodable>(type: ActivityEventType, payload: T) {
-        guard let data = try? JSONEncoder().encode(payload),
+        guard let data = try? Self.payloadEncoder.encode(payload),
               let jsonString = String(data: data, encoding: .utf8) else {
             log.logError("Failed to encode payload for \(type)")
             return
@@ -1135,7 +1138,7 @@ class ActivityStore: ObservableObject {
         }
         
         // Skip tracking Sol Unified's own window changes
-        if bundleId == Bundle.main.bundleIdentifier {
+        if bundleId == ownBundleId {
             return
         }
         
@@ -1427,7 +1430,7 @@ class ActivityStore: ObservableObject {
     
     private func eventFromRow(_ row: [String: Any]) -> ActivityEvent {
         let eventTypeString = row["event_type"] as? String ?? ""
-        let eventType = ActivityEventType(rawValue: eventTypeString) ?? .heartbeat
+        let eventType = ActivityEventType.byRawValue[eventTypeString] ?? .heartbeat
         
         return ActivityEvent(
             id: row["id"] as? Int ?? 0,
@@ -1481,17 +1484,15 @@ class ActivityStore: ObservableObject {
                 break
             }
             
-            let eventsInBucket = getEvents(from: currentStart, to: currentEnd)
-            let intensity = calculateIntensity(events: eventsInBucket)
-            let topApp = findTopApp(in: eventsInBucket)
-            let activeMinutes = calculateActiveMinutes(events: eventsInBucket)
+            let metrics = bucketMetrics(from: currentStart, to: currentEnd)
+            let intensity = calculateIntensity(eventCount: metrics.eventCount, switchCount: metrics.switchCount)
             
             let bucket = TimelineBucket(
                 startTime: currentStart,
                 endTime: currentEnd,
-                eventCount: eventsInBucket.count,
-                activeMinutes: activeMinutes,
-                topApp: topApp,
+                eventCount: metrics.eventCount,
+                activeMinutes: metrics.activeMinutes,
+                topApp: metrics.topApp,
                 intensity: intensity
             )
             
@@ -1514,18 +1515,48 @@ class ActivityStore: ObservableObject {
         return results.map { eventFromRow($0) }
     }
     
-    private func calculateIntensity(events: [ActivityEvent]) -> Double {
-        guard !events.isEmpty else { return 0.0 }
+    /// Aggregates one timeline bucket in SQL; loading every event (key presses and clicks
+    /// included) just to count them made the 30-day view fetch the whole month of rows
+    private func bucketMetrics(from start: Date, to end: Date) -> (eventCount: Int, switchCount: Int, activeMinutes: Int, topApp: String?) {
+        let startString = Database.dateToString(start)
+        let endString = Database.dateToString(end)
+        let appActivate = ActivityEventType.appActivate.rawValue
         
-        // Calculate intensity based on event count and app switches
-        let switchCount = events.filter { $0.eventType == .appActivate }.count
-        let totalEvents = events.count
+        // Timestamps are ISO 8601 in UTC, so the first 16 characters identify the minute
+        let results = db.query(
+            """
+            SELECT COUNT(*) AS event_count,
+                   COALESCE(SUM(event_type = ?), 0) AS switch_count,
+                   COUNT(DISTINCT substr(timestamp, 1, 16)) AS active_minutes,
+                   (SELECT app_name FROM activity_log
+                    WHERE timestamp >= ? AND timestamp < ? AND event_type = ? AND app_name IS NOT NULL
+                    GROUP BY app_name
+                    ORDER BY COUNT(*) DESC
+                    LIMIT 1) AS top_app
+            FROM activity_log
+            WHERE timestamp >= ? AND timestamp < ?
+            """,
+            parameters: [appActivate, startString, endString, appActivate, startString, endString]
+        )
         
+        let row = results.first ?? [:]
+        return (
+            eventCount: row["event_count"] as? Int ?? 0,
+            switchCount: row["switch_count"] as? Int ?? 0,
+            activeMinutes: row["active_minutes"] as? Int ?? 0,
+            topApp: row["top_app"] as? String
+        )
+    }
+    
+    private func calculateIntensity(eventCount: Int, switchCount: Int) -> Double {
+        guard eventCount > 0 else { return 0.0 }
+        
+        // Calculate intensity based on event count and app switches
         // Normalize to 0-1 range
         // For hourly buckets: expect max ~20 events/hour
         // For daily buckets: expect max ~500 events/day
         let maxExpected: Double = 20.0 // Base for hourly
-        let intensity = min(1.0, Double(totalEvents) / maxExpected)
+        let intensity = min(1.0, Double(eventCount) / maxExpected)
         
         // Boost intensity for high switch activity
         let switchBoost = min(0.3, Double(switchCount) / 10.0)
@@ -1533,41 +1564,6 @@ class ActivityStore: ObservableObject {
         return min(1.0, intensity + switchBoost)
     }
     
-    private func findTopApp(in events: [ActivityEvent]) -> String? {
-        var appCounts: [String: Int] = [:]
-        
-        for event in events {
-            if event.eventType == .appActivate,
-               let appName = event.appName {
-                appCounts[appName, default: 0] += 1
-            }
-        }
-        
-        return appCounts.max(by: { $0.value < $1.value })?.key
-    }
-    
-    private func calculateActiveMinutes(events: [ActivityEvent]) -> Int {
-        guard !events.isEmpty else { return 0 }
-        
-        // Count unique minutes with activity
-        var activeMinutes: Set<String> = []
-        let calendar = Calendar.current
-        
-        for event in events {
-            let components = calendar.dateComponents([.year, .month, .day, .hour, .minute], from: event.timestamp)
-            if let year = components.year,
-               let month = components.month,
-               let day = components.day,
-               let hour = components.hour,
-               let minute = components.minute {
-                let minuteKey = "\(year)-\(month)-\(day)-\(hour)-\(minute)"
-                activeMinutes.insert(minuteKey)
-            }
-        }
-        
-        return activeMinutes.count
-    }
-    
     // MARK: - Summary Calculations
     
     func calculateCategorySummaries() -> [CategorySummary] {
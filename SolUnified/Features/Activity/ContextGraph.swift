@@ -179,6 +179,9 @@ class ContextGraphManager: ObservableObject {
     private let db = Database.shared
     private var contextDetectionTimer: Timer?
     
+    // Constant for the process lifetime; read once instead of on every event
+    private let solBundleId = Bundle.main.bundleIdentifier ?? "com.solunified"
+    
     // Pattern detection state
     private var recentApps: [(bundleId: String, appName: String, time: Date)] = []
     private var windowSessionStart: Date?
@@ -190,8 +193,8 @@ class ContextGraphManager: ObservableObject {
     private var eventsSinceLastAnalysis: Int = 0
     private var isIdle: Bool = false
     
-    // App categorization for context type inference
-    private let appCategories: [String: ContextType] = [
+    // App categorization for context type inference (immutable, shared by all instances)
+    private static let appCategories: [String: ContextType] = [
         // Deep work / Creative
         "com.microsoft.VSCode": .creative,
         "com.apple.dt.Xcode": .creative,
@@ -235,6 +238,10 @@ class ContextGraphManager: ObservableObject {
         "tv.twitch": .leisure
     ]
     
+    // Shared coders for the JSON columns; every node and edge row used to build its own
+    private static let encoder = JSONEncoder()
+    private static let decoder = JSONDecoder()
+    
     private init() {
         loadContextGraph()
     }
@@ -307,7 +314,6 @@ class ContextGraphManager: ObservableObject {
         // Update recent apps tracking - EXCLUDE Sol Unified itself to avoid self-pollution
         if let bundleId = event.appBundleId, let appName = event.appName {
             // Skip Sol Unified's own events for context detection
-            let solBundleId = Bundle.main.bundleIdentifier ?? "com.solunified"
             guard bundleId != solBundleId else { return }
             
             recentApps.append((bundleId: bundleId, appName: appName, time: event.timestamp))
@@ -489,12 +495,8 @@ class ContextGraphManager: ObservableObject {
         var counts: [String: (name: String, count: Int)] = [:]
         
         for event in events {
-            if var existing = counts[event.bundleId] {
-                existing.count += 1
-                counts[event.bundleId] = existing
-            } else {
-                counts[event.bundleId] = (name: event.appName, count: 1)
-            }
+            // Single in-place hash access instead of a lookup followed by a write-back
+            counts[event.bundleId, default: (name: event.appName, count: 0)].count += 1
         }
         
         guard let top = counts.max(by: { $0.value.count < $1.value.count }) else { return nil }
@@ -519,20 +521,37 @@ class ContextGraphManager: ObservableObject {
         guard let dominant = dominantApp else { return .unknown }
         
         // Check if dominant app has a category
-        if let category = appCategories[dominant.bundleId] {
+        if let category = Self.appCategories[dominant.bundleId] {
             return category
         }
         
-        // Infer from app mix
-        let categoryScores: [ContextType: Int] = apps.reduce(into: [:]) { scores, bundleId in
-            if let category = appCategories[bundleId] {
-                scores[category, default: 0] += 1
+        // Infer from app mix: tally into a fixed array indexed by context type
+        var categoryScores = [Int](repeating: 0, count: Self.contextTypes.count)
+        for bundleId in apps {
+            if let index = Self.appCategoryIndex[bundleId] {
+                categoryScores[index] += 1
             }
         }
         
-        return categoryScores.max(by: { $0.value < $1.value })?.key ?? .unknown
+        var bestIndex: Int?
+        var bestScore = 0
+        for (index, score) in categoryScores.enumerated() where score > bestScore {
+            bestIndex = index
+            bestScore = score
+        }
+        
+        return bestIndex.map { Self.contextTypes[$0] } ?? .unknown
     }
     
+    private static let contextTypes = ContextType.allCases
+
+    /// Bundle ID -> position in `contextTypes`. The tally loop works on plain ints; keying a
+    /// dictionary by the String-backed enum would hash its raw string on every lookup.
+    private static let appCategoryIndex: [String: Int] = {
+        let indexByType = Dictionary(uniqueKeysWithValues: contextTypes.enumerated().map { ($0.element, $0.offset) })
+        return appCategories.compactMapValues { indexByType[$0] }
+    }()
+    
     private func generateContextLabel(dominantApp: (bundleId: String, appName: String)?, type: ContextType, apps: Set<String>) -> String {
         guard let dominant = dominantApp else { return "Unknown Activity" }
         
@@ -554,9 +573,10 @@ class ContextGraphManager: ObservableObject {
         }
     }
     
+    private static let browsers: Set<String> = ["com.apple.Safari", "com.google.Chrome", "com.brave.Browser", "org.mozilla.firefox", "com.microsoft.edgemac"]
+
     private func isBrowser(_ bundleId: String) -> Bool {
-        let browsers = ["com.apple.Safari", "com.google.Chrome", "com.brave.Browser", "org.mozilla.firefox", "com.microsoft.edgemac"]
-        return browsers.contains(bundleId)
+        return Self.browsers.contains(bundleId)
     }
     
     private func extractURLFromTitle(_ title: String) -> String? {
@@ -602,9 +622,9 @@ class ContextGraphManager: ObservableObject {
         nodes.insert(node, at: 0)
         
         // Persist to database
-        guard let appsJson = try? JSONEncoder().encode(Array(node.apps)),
+        guard let appsJson = try? Self.encoder.encode(Array(node.apps)),
               let appsString = String(data: appsJson, encoding: .utf8),
-              let windowsJson = try? JSONEncoder().encode(node.windowTitles),
+              let windowsJson = try? Self.encoder.encode(node.windowTitles),
               let windowsString = String(data: windowsJson, encoding: .utf8) else {
             return
         }
@@ -633,9 +653,9 @@ class ContextGraphManager: ObservableObject {
             nodes[index] = node
         }
         
-        guard let appsJson = try? JSONEncoder().encode(Array(node.apps)),
+        guard let appsJson = try? Self.encoder.encode(Array(node.apps)),
               let appsString = String(data: appsJson, encoding: .utf8),
-              let windowsJson = try? JSONEncoder().encode(node.windowTitles),
+              let windowsJson = try? Self.encoder.encode(node.windowTitles),
               let windowsString = String(data: windowsJson, encoding: .utf8) else {
             return
         }
@@ -665,7 +685,7 @@ class ContextGraphManager: ObservableObject {
     private func addEdge(_ edge: ContextEdge) {
         edges.insert(edge, at: 0)
         
-        guard let metadataJson = try? JSONEncoder().encode(edge.metadata),
+        guard let metadataJson = try? Self.encoder.encode(edge.metadata),
               let metadataString = String(data: metadataJson, encoding: .utf8) else {
             return
         }
@@ -707,13 +727,13 @@ class ContextGraphManager: ObservableObject {
         
         if let appsStr = row["apps"] as? String,
            let appsData = appsStr.data(using: .utf8),
-           let appsArray = try? JSONDecoder().decode([String].self, from: appsData) {
+           let appsArray = try? Self.decoder.decode([String].self, from: appsData) {
             node.apps = Set(appsArray)
         }
         
         if let windowsStr = row["window_titles"] as? String,
            let windowsData = windowsStr.data(using: .utf8),
-           let windowsArray = try? JSONDecoder().decode([String].self, from: windowsData) {
+           let windowsArray = try? Self.decoder.decode([String].self, from: windowsData) {
             node.windowTitles = windowsArray
         }
         
@@ -735,7 +755,7 @@ class ContextGraphManager: ObservableObject {
         
         if let metadataStr = row["metadata"] as? String,
            let metadataData = metadataStr.data(using: .utf8),
-           let metadata = try? JSONDecoder().decode([String: String].self, from: metadataData) {
+           let metadata = try? Self.decoder.decode([String: String].self, from: metadataData) {
             edge.metadata = metadata
         }
         
@@ -51,7 +51,7 @@ class DataSyncService {
         // Let's just do manual mapping here since we need it for export
         return results.compactMap { row in
             guard let eventTypeStr = row["event_type"] as? String,
-                  let eventType = ActivityEventType(rawValue: eventTypeStr),
+                  let eventType = ActivityEventType.byRawValue[eventTypeStr],
                   let timestampStr = row["timestamp"] as? String,
                   let timestamp = Database.stringToDate(timestampStr),
                   let createdAtStr = row["created_at"] as? String,
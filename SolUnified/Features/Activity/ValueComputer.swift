@@ -110,24 +110,35 @@ class ValueComputer: ObservableObject {
             return (1.0, 0.0, "idle")
         }
         
+        // Single pass: count switches, actions and per-app events without intermediate arrays
+        var appSwitches = 0
+        var actions = 0
+        var appCounts: [String: Int] = [:]
+        
+        for event in events {
+            switch event.eventType {
+            case .appActivate:
+                appSwitches += 1
+            case .keyPress, .mouseClick, .internalNoteEdit:
+                actions += 1
+            default:
+                break
+            }
+            
+            if let app = event.appName {
+                appCounts[app, default: 0] += 1
+            }
+        }
+        
         // Focus: 1.0 - (App Switches * Penalty)
-        let appSwitches = events.filter { $0.eventType == .appActivate }.count
         let rawFocus = 1.0 - (Double(appSwitches) * focusDecayPerSwitch)
         let focusScore = max(0.0, min(1.0, rawFocus))
         
         // Velocity: Actions / MaxCapacity
-        let actions = events.filter {
-            $0.eventType == .keyPress ||
-            $0.eventType == .mouseClick ||
-            $0.eventType == .internalNoteEdit
-        }.count
         let velocityScore = min(1.0, Double(actions) / maxVelocity)
         
         // Dominant App
-        let dominantApp = events
-            .compactMap { $0.appName }
-            .reduce(into: [:]) { counts, app in counts[app, default: 0] += 1 }
-            .max(by: { $0.value < $1.value })?.key ?? "unknown"
+        let dominantApp = appCounts.max(by: { $0.value < $1.value })?.key ?? "unknown"
             
         return (focusScore, velocityScore, dominantApp)
     }
@@ -140,9 +151,10 @@ class ValueComputer: ObservableObject {
         else { return 0.6 } // Baseline
     }
     
+    private static let ambiguousApps: Set<String> = ["Google Chrome", "Safari", "Arc", "Firefox", "Slack", "Discord"]
+
     private func isAmbiguousContext(_ appName: String) -> Bool {
-        let ambiguousApps = ["Google Chrome", "Safari", "Arc", "Firefox", "Slack", "Discord"]
-        return ambiguousApps.contains(appName)
+        return Self.ambiguousApps.contains(appName)
     }
     
     // MARK: - Vision Logic
@@ -215,7 +227,9 @@ class ValueComputer: ObservableObject {
             Database.dateToString(Date())
         ])
         
+        #if DEBUG
         print("🧠 State Vector: F=\(String(format: "%.2f", focus)) V=\(String(format: "%.2f", velocity)) C=\(context)")
+        #endif
     }
 }
 
@@ -7,14 +7,14 @@
 
 import Foundation
 
-class ClaudeAPIClient: ObservableObject {
+final class ClaudeAPIClient: ObservableObject {
     static let shared = ClaudeAPIClient()
 
     @Published var isProcessing = false
     @Published var lastError: String?
 
-    private let baseURL = "https://api.anthropic.com/v1/messages"
-    private let apiVersion = "2023-06-01"
+    private static let endpoint = URL(string: "https://api.anthropic.com/v1/messages")!
+    private static let apiVersion = "2023-06-01"
     private let defaultModel = "claude-sonnet-4-20250514"
 
     private var apiKey: String {
@@ -22,6 +22,19 @@ class ClaudeAPIClient: ObservableObject {
         return AppSettings.shared.claudeAPIKey
     }
 
+    // One long-lived session so keep-alive connections to the API are reused across turns
+    private let session: URLSession = {
+        let config = URLSessionConfiguration.default
+        config.httpMaximumConnectionsPerHost = 8
+        config.timeoutIntervalForRequest = 60
+        config.timeoutIntervalForResource = 300
+        config.requestCachePolicy = .reloadIgnoringLocalCacheData
+        config.urlCache = nil
+        // Headers that never change between requests live on the session
+        config.httpAdditionalHeaders = ["anthropic-version": ClaudeAPIClient.apiVersion]
+        return URLSession(configuration: config)
+    }()
+
     private init() {}
 
     // MARK: - Public API
@@ -29,6 +42,7 @@ class ClaudeAPIClient: ObservableObject {
     func complete(
         messages: [ChatMessage],
         systemPrompt: String,
+        cachedSystemPrefix: String? = nil,
         tools: [AgentTool] = [],
         maxTokens: Int = 4096
     ) async throws -> LLMResponse {
@@ -42,11 +56,12 @@ class ClaudeAPIClient: ObservableObject {
         let request = try buildRequest(
             messages: messages,
             systemPrompt: systemPrompt,
+            cachedSystemPrefix: cachedSystemPrefix,
             tools: tools,
             maxTokens: maxTokens
         )
 
-        let (data, response) = try await URLSession.shared.data(for: request)
+        let (data, response) = try await session.data(for: request)
 
         guard let httpResponse = response as? HTTPURLResponse else {
             throw ClaudeAPIError.invalidResponse
@@ -69,6 +84,7 @@ class ClaudeAPIClient: ObservableObject {
         return try await complete(
             messages: messages,
             systemPrompt: systemPrompt,
+            cachedSystemPrefix: Self.systemPromptPrefix,
             tools: tools
         )
     }
@@ -78,14 +94,14 @@ class ClaudeAPIClient: ObservableObject {
     private func buildRequest(
         messages: [ChatMessage],
         systemPrompt: String,
+        cachedSystemPrefix: String?,
         tools: [AgentTool],
         maxTokens: Int
     ) throws -> URLRequest {
-        var request = URLRequest(url: URL(string: baseURL)!)
+        var request = URLRequest(url: Self.endpoint)
         request.httpMethod = "POST"
         request.setValue("application/json", forHTTPHeaderField: "Content-Type")
         request.setValue(apiKey, forHTTPHeaderField: "x-api-key")
-        request.setValue(apiVersion, forHTTPHeaderField: "anthropic-version")
 
         var body: [String: Any] = [
             "model": defaultModel,
@@ -94,8 +110,23 @@ class ClaudeAPIClient: ObservableObject {
             "messages": messages.map { messageToDict($0) }
         ]
 
+        // Mark the stable prefix as cacheable so tools + instructions aren't re-processed every turn
+        if let prefix = cachedSystemPrefix {
+            body["system"] = [
+                [
+                    "type": "text",
+                    "text": prefix,
+                    "cache_control": ["type": "ephemeral"]
+                ],
+                [
+                    "type": "text",
+                    "text": systemPrompt
+                ]
+            ]
+        }
+
         if !tools.isEmpty {
-            body["tools"] = tools.map { toolToDict($0) }
+            body["tools"] = tools.compactMap { Self.toolDefinitions[$0] }
         }
 
         request.httpBody = try JSONSerialization.data(withJSONObject: body)
@@ -162,7 +193,12 @@ class ClaudeAPIClient: ObservableObject {
         return dict
     }
 
-    private func toolToDict(_ tool: AgentTool) -> [String: Any] {
+    /// Tool definitions are identical on every request, so build them once
+    private static let toolDefinitions: [AgentTool: [String: Any]] = Dictionary(
+        uniqueKeysWithValues: AgentTool.allCases.map { ($0, toolToDict($0)) }
+    )
+
+    private static func toolToDict(_ tool: AgentTool) -> [String: Any] {
         return [
             "name": tool.rawValue,
             "description": tool.description,
@@ -170,7 +206,7 @@ class ClaudeAPIClient: ObservableObject {
         ]
     }
 
-    private func getToolSchema(_ tool: AgentTool) -> [String: Any] {
+    private static func getToolSchema(_ tool: AgentTool) -> [String: Any] {
         switch tool {
         case .lookupContact:
             return [
@@ -506,73 +542,91 @@ class ClaudeAPIClient: ObservableObject {
 
     // MARK: - System Prompt
 
-    private func buildSystemPrompt(with context: AssembledContext) -> String {
-        var prompt = """
-        You are a helpful AI assistant integrated into Sol Unified, a personal productivity app. You help the user accomplish tasks efficiently by leveraging your knowledge about them and their context.
+    /// Instructions that never change between requests. Sent first so the API can cache it.
+    private static let systemPromptPrefix = """
+    You are a helpful AI assistant integrated into Sol Unified, a personal productivity app. You help the user accomplish tasks efficiently by leveraging your knowledge about them and their context.
 
-        Current date and time: \(ISO8601DateFormatter().string(from: context.timestamp))
+    GUIDELINES:
+    - Be concise and helpful
+    - Use the tools available to you when needed
+    - Don't ask for information you already have access to
+    - When scheduling or creating events, confirm details before executing
+    - Learn from interactions and save important facts to memory
+    """
 
-        """
+    /// Per-request portion of the system prompt, appended after the cached prefix.
+    /// Written into one buffer sized up front rather than concatenating interpolated pieces.
+    private func buildSystemPrompt(with context: AssembledContext) -> String {
+        var prompt = ""
+        prompt.reserveCapacity(estimatedPromptLength(for: context))
+
+        prompt += "Current date and time: "
+        prompt += Database.dateToString(context.timestamp)
+        prompt += "\n"
 
         // Add work context
         if let workContext = context.workContext {
-            prompt += """
-
-            CURRENT WORK CONTEXT:
-            \(workContext)
-
-            """
+            prompt += "\nCURRENT WORK CONTEXT:\n"
+            prompt += workContext
+            prompt += "\n"
         }
 
         // Add memories
         if !context.memories.isEmpty {
-            prompt += """
-
-            WHAT I KNOW ABOUT THE USER:
-            """
+            prompt += "\nWHAT I KNOW ABOUT THE USER:"
             for memory in context.memories {
-                prompt += "\n- \(memory.key): \(memory.value)"
+                prompt += "\n- "
+                prompt += memory.key
+                prompt += ": "
+                prompt += memory.value
             }
             prompt += "\n"
         }
 
         // Add relevant contacts
         if !context.contacts.isEmpty {
-            prompt += """
-
-            RELEVANT CONTACTS:
-            """
+            prompt += "\nRELEVANT CONTACTS:"
             for contact in context.contacts {
-                var contactInfo = "- \(contact.name)"
-                if let email = contact.email { contactInfo += " (\(email))" }
-                if let company = contact.company { contactInfo += " - \(company)" }
-                prompt += "\n\(contactInfo)"
+                prompt += "\n- "
+                prompt += contact.name
+                if let email = contact.email {
+                    prompt += " ("
+                    prompt += email
+                    prompt += ")"
+                }
+                if let company = contact.company {
+                    prompt += " - "
+                    prompt += company
+                }
             }
             prompt += "\n"
         }
 
         // Add clipboard context if relevant
         if let clipboardContext = context.clipboardContext {
-            prompt += """
-
-            RECENT CLIPBOARD:
-            \(clipboardContext)
-
-            """
+            prompt += "\nRECENT CLIPBOARD:\n"
+            prompt += clipboardContext
+            prompt += "\n"
         }
 
-        prompt += """
-
-        GUIDELINES:
-        - Be concise and helpful
-        - Use the tools available to you when needed
-        - Don't ask for information you already have access to
-        - When scheduling or creating events, confirm details before executing
-        - Learn from interactions and save important facts to memory
-        """
-
         return prompt
     }
+
+    /// Upper-bound guess in UTF-8 bytes; headers and separators are covered by the fixed slack
+    private func estimatedPromptLength(for context: AssembledContext) -> Int {
+        var length = 256
+        length += context.workContext?.utf8.count ?? 0
+        length += context.clipboardContext?.utf8.count ?? 0
+        for memory in context.memories {
+            length += memory.key.utf8.count + memory.value.utf8.count + 6
+        }
+        for contact in context.contacts {
+            length += contact.name.utf8.count + 8
+            length += contact.email?.utf8.count ?? 0
+            length += contact.company?.utf8.count ?? 0
+        }
+        return length
+    }
 }
 
 // MARK: - Errors
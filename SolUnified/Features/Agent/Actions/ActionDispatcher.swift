@@ -7,9 +7,10 @@
 
 import Foundation
 
-class ActionDispatcher {
+final class ActionDispatcher {
 
-    private let calendarExecutor = CalendarActionExecutor()
+    // Lazy so the EKEventStore is only created once a calendar tool is actually called
+    private lazy var calendarExecutor = CalendarActionExecutor()
 
     // MARK: - Dispatch
 
@@ -199,7 +200,7 @@ class ActionDispatcher {
                 var dict: [String: Any] = [
                     "type": "clipboard",
                     "content_type": item.contentType.rawValue,
-                    "created_at": ISO8601DateFormatter().string(from: item.createdAt)
+                    "created_at": Database.dateToString(item.createdAt)
                 ]
                 if let text = item.contentText {
                     dict["content"] = String(text.prefix(200))
@@ -623,9 +624,16 @@ class ActionDispatcher {
 
     // MARK: - Helpers
 
+    private static let argumentDecoder = JSONDecoder()
+
     private func parseArguments<T: Decodable>(_ json: String, as type: T.Type) -> T? {
-        guard let data = json.data(using: .utf8) else { return nil }
-        return try? JSONDecoder().decode(type, from: data)
+        do {
+            return try Self.argumentDecoder.decode(type, from: Data(json.utf8))
+        } catch {
+            // Surface the real decoding failure instead of silently collapsing it to nil
+            print("⚠️ Failed to decode \(T.self) from tool arguments: \(error)")
+            return nil
+        }
     }
 }
 
@@ -8,7 +8,7 @@
 import Foundation
 import EventKit
 
-class CalendarActionExecutor {
+final class CalendarActionExecutor {
 
     private let eventStore = EKEventStore()
     private var hasAccess = false
@@ -20,6 +20,18 @@ class CalendarActionExecutor {
             return true
         }
 
+        // Read the current authorization status first; it is a cheap local check and, unlike
+        // a cached result, picks up a grant made in System Settings since the last call
+        let status = EKEventStore.authorizationStatus(for: .event)
+        if Self.isFullAccess(status) {
+            hasAccess = true
+            return true
+        }
+        if status == .denied || status == .restricted {
+            // The system won't prompt again; the user has to change this in System Settings
+            return false
+        }
+
         let granted: Bool
         if #available(macOS 14.0, *) {
             granted = try await eventStore.requestFullAccessToEvents()
@@ -39,6 +51,13 @@ class CalendarActionExecutor {
         return granted
     }
 
+    private static func isFullAccess(_ status: EKAuthorizationStatus) -> Bool {
+        if #available(macOS 14.0, *) {
+            return status == .fullAccess
+        }
+        return status == .authorized
+    }
+
     // MARK: - Check Availability
 
     func checkAvailability(_ toolCall: ToolCall) async throws -> ToolResult {
@@ -79,8 +98,8 @@ class CalendarActionExecutor {
         // Build busy slots
         let busySlots = events.map { event -> [String: String] in
             return [
-                "start": ISO8601DateFormatter().string(from: event.startDate),
-                "end": ISO8601DateFormatter().string(from: event.endDate),
+                "start": Self.iso8601Formatter.string(from: event.startDate),
+                "end": Self.iso8601Formatter.string(from: event.endDate),
                 "title": event.title ?? "Busy"
             ]
         }
@@ -182,7 +201,7 @@ class CalendarActionExecutor {
                 "event_id": event.eventIdentifier ?? "unknown",
                 "title": args.title,
                 "start": args.startTime,
-                "end": ISO8601DateFormatter().string(from: event.endDate),
+                "end": Self.iso8601Formatter.string(from: event.endDate),
                 "calendar": event.calendar.title
             ]
 
@@ -214,33 +233,27 @@ class CalendarActionExecutor {
 
     // MARK: - Helpers
 
+    // Formatters are expensive to create; build them once and share across calls
+    private static let iso8601Formatter = ISO8601DateFormatter()
+
+    private static let fallbackFormatters: [DateFormatter] = [
+        "yyyy-MM-dd'T'HH:mm:ss",
+        "yyyy-MM-dd HH:mm",
+        "yyyy-MM-dd"
+    ].map { format in
+        let f = DateFormatter()
+        f.dateFormat = format
+        return f
+    }
+
     private func parseDate(_ dateString: String) -> Date? {
         // Try ISO 8601 first
-        let iso8601 = ISO8601DateFormatter()
-        if let date = iso8601.date(from: dateString) {
+        if let date = Self.iso8601Formatter.date(from: dateString) {
             return date
         }
 
         // Try common date formats
-        let formatters: [DateFormatter] = [
-            {
-                let f = DateFormatter()
-                f.dateFormat = "yyyy-MM-dd'T'HH:mm:ss"
-                return f
-            }(),
-            {
-                let f = DateFormatter()
-                f.dateFormat = "yyyy-MM-dd HH:mm"
-                return f
-            }(),
-            {
-                let f = DateFormatter()
-                f.dateFormat = "yyyy-MM-dd"
-                return f
-            }()
-        ]
-
-        for formatter in formatters {
+        for formatter in Self.fallbackFormatters {
             if let date = formatter.date(from: dateString) {
                 return date
             }
@@ -250,6 +263,8 @@ class CalendarActionExecutor {
         return parseNaturalDate(dateString)
     }
 
+    private static let weekdays = ["sunday", "monday", "tuesday", "wednesday", "thursday", "friday", "saturday"]
+
     private func parseNaturalDate(_ string: String) -> Date? {
         let lowercased = string.lowercased()
         let calendar = Calendar.current
@@ -264,8 +279,7 @@ class CalendarActionExecutor {
         }
 
         // Try to parse weekday names
-        let weekdays = ["sunday", "monday", "tuesday", "wednesday", "thursday", "friday", "saturday"]
-        for (index, day) in weekdays.enumerated() {
+        for (index, day) in Self.weekdays.enumerated() {
             if lowercased.contains(day) {
                 let targetWeekday = index + 1  // Calendar weekdays are 1-indexed
                 let components = calendar.dateComponents([.weekday], from: now)
@@ -295,7 +309,7 @@ class CalendarActionExecutor {
         let workingHoursEnd = 18
 
         var currentDate = startDate
-        let dateFormatter = ISO8601DateFormatter()
+        let dateFormatter = Self.iso8601Formatter
 
         while currentDate < endDate {
             // Get start of working day
@@ -352,9 +366,16 @@ class CalendarActionExecutor {
         return freeSlots
     }
 
+    private static let argumentDecoder = JSONDecoder()
+
     private func parseArguments<T: Decodable>(_ json: String, as type: T.Type) -> T? {
-        guard let data = json.data(using: .utf8) else { return nil }
-        return try? JSONDecoder().decode(type, from: data)
+        do {
+            return try Self.argumentDecoder.decode(type, from: Data(json.utf8))
+        } catch {
+            // Surface the real decoding failure instead of silently collapsing it to nil
+            print("⚠️ Failed to decode \(T.self) from calendar tool arguments: \(error)")
+            return nil
+        }
     }
 }
 
@@ -8,14 +8,24 @@
 import Foundation
 import Combine
 
-class ContactsStore: ObservableObject {
+final class ContactsStore: ObservableObject {
     static let shared = ContactsStore()
 
-    @Published var contacts: [Contact] = []
+    @Published var contacts: [Contact] = [] {
+        didSet { rebuildIndexes() }
+    }
     @Published var isLoading = false
 
     private let db = Database.shared
 
+    // Lookup indexes over `contacts`, rebuilt whenever it changes
+    private var contactsById: [String: Contact] = [:]
+    private var contactMatchFields: [(contact: Contact, fields: [String])] = []  // lowercased name, nickname, email
+
+    // Shared coders; creating them per row dominated message (de)serialization
+    private static let encoder = JSONEncoder()
+    private static let decoder = JSONDecoder()
+
     private init() {
         loadContacts()
     }
@@ -33,7 +43,7 @@ class ContactsStore: ObservableObject {
 
     @discardableResult
     func saveContact(_ contact: Contact) -> Bool {
-        let preferencesJson = try? JSONEncoder().encode(contact.preferences)
+        let preferencesJson = try? Self.encoder.encode(contact.preferences)
         let preferencesStr = preferencesJson.flatMap { String(data: $0, encoding: .utf8) }
 
         let sql = """
@@ -88,15 +98,13 @@ class ContactsStore: ObservableObject {
             return []
         }
 
-        return contacts.filter { contact in
-            contact.name.lowercased().contains(normalized) ||
-            (contact.nickname?.lowercased().contains(normalized) ?? false) ||
-            (contact.email?.lowercased().contains(normalized) ?? false)
-        }
+        return contactMatchFields
+            .filter { entry in entry.fields.contains { $0.contains(normalized) } }
+            .map { $0.contact }
     }
 
     func getContact(id: String) -> Contact? {
-        return contacts.first { $0.id == id }
+        return contactsById[id]
     }
 
     func getContactsByRelationship(_ relationship: ContactRelationship) -> [Contact] {
@@ -111,6 +119,16 @@ class ContactsStore: ObservableObject {
             .map { $0 }
     }
 
+    // MARK: - Indexes
+
+    private func rebuildIndexes() {
+        // Keep the first occurrence to match the previous first(where:) semantics
+        contactsById = Dictionary(contacts.map { ($0.id, $0) }, uniquingKeysWith: { first, _ in first })
+        contactMatchFields = contacts.map { contact in
+            (contact: contact, fields: [contact.name, contact.nickname, contact.email].compactMap { $0?.lowercased() })
+        }
+    }
+
     // MARK: - Search
 
     func searchContacts(query: String) -> [Contact] {
@@ -201,7 +219,7 @@ class ContactsStore: ObservableObject {
         var preferences = ContactPreferences()
         if let preferencesStr = row["preferences"] as? String,
            let preferencesData = preferencesStr.data(using: .utf8) {
-            preferences = (try? JSONDecoder().decode(ContactPreferences.self, from: preferencesData)) ?? ContactPreferences()
+            preferences = (try? Self.decoder.decode(ContactPreferences.self, from: preferencesData)) ?? ContactPreferences()
         }
 
         return Contact(
@@ -8,7 +8,7 @@
 import Foundation
 import Combine
 
-class ConversationStore: ObservableObject {
+final class ConversationStore: ObservableObject {
     static let shared = ConversationStore()
 
     @Published var conversations: [Conversation] = []
@@ -17,6 +17,23 @@ class ConversationStore: ObservableObject {
 
     private let db = Database.shared
 
+    // Shared coders; creating them per row dominated message (de)serialization
+    private static let encoder = JSONEncoder()
+    private static let decoder = JSONDecoder()
+
+    // Tail of each conversation's history, appended on save so an LLM turn doesn't reload it
+    private struct CachedTail {
+        var messages: [ChatMessage]
+        var lastUsed: UInt64
+    }
+
+    private static let maxCachedMessages = 50
+    private static let maxCachedConversations = 16
+
+    private var recentMessagesCache: [String: CachedTail] = [:]
+    private var recentMessagesClock: UInt64 = 0  // bumped on every cache touch; lowest lastUsed is evicted
+    private let recentMessagesQueue = DispatchQueue(label: "com.solunified.conversationstore.recent")
+
     private init() {
         loadConversations()
     }
@@ -52,6 +69,50 @@ class ConversationStore: ObservableObject {
         return results.compactMap { messageFromRow($0) }
     }
 
+    /// The last `limit` messages, oldest first, served from the write-through tail cache
+    func recentMessages(forConversationId conversationId: String, limit: Int) -> [ChatMessage] {
+        guard limit <= Self.maxCachedMessages else {
+            return loadRecentMessages(forConversationId: conversationId, limit: limit)
+        }
+
+        // Saves hold the same queue, so the loaded tail can't miss or double up a message
+        let tail: [ChatMessage] = recentMessagesQueue.sync {
+            recentMessagesClock += 1
+            if var cached = recentMessagesCache[conversationId] {
+                cached.lastUsed = recentMessagesClock
+                recentMessagesCache[conversationId] = cached
+                return cached.messages
+            }
+            // A tail shorter than the cache size is the whole history, so any smaller limit is exact
+            let loaded = loadRecentMessages(forConversationId: conversationId, limit: Self.maxCachedMessages)
+            recentMessagesCache[conversationId] = CachedTail(messages: loaded, lastUsed: recentMessagesClock)
+            evictStaleTailIfNeeded()
+            return loaded
+        }
+        return Array(tail.suffix(limit))
+    }
+
+    /// Keeps only the most recently used conversations; call on recentMessagesQueue
+    private func evictStaleTailIfNeeded() {
+        guard recentMessagesCache.count > Self.maxCachedConversations,
+              let oldest = recentMessagesCache.min(by: { $0.value.lastUsed < $1.value.lastUsed })?.key else {
+            return
+        }
+        recentMessagesCache.removeValue(forKey: oldest)
+    }
+
+    private func loadRecentMessages(forConversationId conversationId: String, limit: Int) -> [ChatMessage] {
+        let results = db.query(
+            """
+            SELECT * FROM (
+                SELECT * FROM chat_messages WHERE conversation_id = ? ORDER BY timestamp DESC LIMIT ?
+            ) ORDER BY timestamp ASC
+            """,
+            parameters: [conversationId, limit]
+        )
+        return results.compactMap { messageFromRow($0) }
+    }
+
     // MARK: - Create
 
     func createConversation(title: String? = nil) -> Conversation {
@@ -95,11 +156,13 @@ class ConversationStore: ObservableObject {
 
     @discardableResult
     func saveMessage(_ message: ChatMessage, toConversationId conversationId: String) -> Bool {
-        let toolCallsJson = message.toolCalls.flatMap { try? JSONEncoder().encode($0) }
-        let toolCallsStr = toolCallsJson.flatMap { String(data: $0, encoding: .utf8) }
+        return saveMessages([message], toConversationId: conversationId)
+    }
 
-        let toolResultsJson = message.toolResults.flatMap { try? JSONEncoder().encode($0) }
-        let toolResultsStr = toolResultsJson.flatMap { String(data: $0, encoding: .utf8) }
+    /// Inserts the messages and bumps the conversation's updated_at in a single transaction
+    @discardableResult
+    func saveMessages(_ messages: [ChatMessage], toConversationId conversationId: String) -> Bool {
+        guard !messages.isEmpty else { return true }
 
         let sql = """
             INSERT INTO chat_messages
@@ -107,29 +170,48 @@ class ConversationStore: ObservableObject {
             VALUES (?, ?, ?, ?, ?, ?, ?)
         """
 
-        let success = db.execute(sql, parameters: [
-            message.id,
-            conversationId,
-            message.role.rawValue,
-            message.content,
-            toolCallsStr ?? NSNull(),
-            toolResultsStr ?? NSNull(),
-            Database.dateToString(message.timestamp)
-        ])
+        var statements = messages.map { message -> (sql: String, parameters: [Any]) in
+            let toolCallsJson = message.toolCalls.flatMap { try? Self.encoder.encode($0) }
+            let toolCallsStr = toolCallsJson.flatMap { String(data: $0, encoding: .utf8) }
+
+            let toolResultsJson = message.toolResults.flatMap { try? Self.encoder.encode($0) }
+            let toolResultsStr = toolResultsJson.flatMap { String(data: $0, encoding: .utf8) }
+
+            return (sql, [
+                message.id,
+                conversationId,
+                message.role.rawValue,
+                message.content,
+                toolCallsStr ?? NSNull(),
+                toolResultsStr ?? NSNull(),
+                Database.dateToString(message.timestamp)
+            ])
+        }
 
-        if success {
-            // Update conversation's updated_at
-            _ = db.execute(
-                "UPDATE conversations SET updated_at = ? WHERE id = ?",
-                parameters: [Database.dateToString(Date()), conversationId]
-            )
-
-            // Update current conversation if it matches
-            if currentConversation?.id == conversationId {
-                DispatchQueue.main.async { [weak self] in
-                    self?.currentConversation?.messages.append(message)
-                    self?.currentConversation?.updatedAt = Date()
-                }
+        // Update conversation's updated_at
+        statements.append((
+            "UPDATE conversations SET updated_at = ? WHERE id = ?",
+            [Database.dateToString(Date()), conversationId]
+        ))
+
+        // Write and extend the cached tail as one step so a concurrent cache load can't also
+        // pick these messages up; an uncached conversation loads fresh on the next read
+        let success: Bool = recentMessagesQueue.sync {
+            guard db.executeBatch(statements) else { return false }
+            if var cached = recentMessagesCache[conversationId] {
+                recentMessagesClock += 1
+                cached.messages = Array((cached.messages + messages).suffix(Self.maxCachedMessages))
+                cached.lastUsed = recentMessagesClock
+                recentMessagesCache[conversationId] = cached
+            }
+            return true
+        }
+
+        // Update current conversation if it matches
+        if success && currentConversation?.id == conversationId {
+            DispatchQueue.main.async { [weak self] in
+                self?.currentConversation?.messages.append(contentsOf: messages)
+                self?.currentConversation?.updatedAt = Date()
             }
         }
 
@@ -142,6 +224,10 @@ class ConversationStore: ObservableObject {
         _ = saveMessage(message, toConversationId: conversation.id)
     }
 
+    func addMessages(_ messages: [ChatMessage], to conversation: Conversation) {
+        _ = saveMessages(messages, toConversationId: conversation.id)
+    }
+
     func addUserMessage(_ content: String, to conversation: Conversation) -> ChatMessage {
         let message = ChatMessage(role: .user, content: content)
         addMessage(message, to: conversation)
@@ -192,6 +278,9 @@ class ConversationStore: ObservableObject {
     func deleteConversation(id: String) -> Bool {
         // Delete messages first
         _ = db.execute("DELETE FROM chat_messages WHERE conversation_id = ?", parameters: [id])
+        recentMessagesQueue.sync {
+            recentMessagesCache[id] = nil
+        }
         // Then delete conversation
         let success = db.execute("DELETE FROM conversations WHERE id = ?", parameters: [id])
 
@@ -290,13 +379,13 @@ class ConversationStore: ObservableObject {
         var toolCalls: [ToolCall]?
         if let toolCallsStr = row["tool_calls"] as? String,
            let toolCallsData = toolCallsStr.data(using: .utf8) {
-            toolCalls = try? JSONDecoder().decode([ToolCall].self, from: toolCallsData)
+            toolCalls = try? Self.decoder.decode([ToolCall].self, from: toolCallsData)
         }
 
         var toolResults: [ToolResult]?
         if let toolResultsStr = row["tool_results"] as? String,
            let toolResultsData = toolResultsStr.data(using: .utf8) {
-            toolResults = try? JSONDecoder().decode([ToolResult].self, from: toolResultsData)
+            toolResults = try? Self.decoder.decode([ToolResult].self, from: toolResultsData)
         }
 
         return ChatMessage(
@@ -8,7 +8,7 @@
 import Foundation
 import Combine
 
-class AgentCore: ObservableObject {
+final class AgentCore: ObservableObject {
     static let shared = AgentCore()
 
     // Dependencies
@@ -64,7 +64,6 @@ class AgentCore: ObservableObject {
         // 3. Assemble context
         let context = await contextAssembler.assembleContext(
             for: content,
-            conversation: conv,
             memoryStore: memoryStore,
             contactsStore: contactsStore
         )
@@ -72,7 +71,7 @@ class AgentCore: ObservableObject {
         // 4. Determine which tools to enable
         let tools = determineTools(for: context)
 
-        // 5. Get conversation history for API
+        // 5. Load conversation history for API
         let messagesForAPI = getMessagesForAPI(conversation: conv)
 
         do {
@@ -93,7 +92,7 @@ class AgentCore: ObservableObject {
             conversationStore.addMessage(assistantMessage, to: conv)
 
             // 9. Learn from interaction
-            await memoryStore.learnFromInteraction(userMessage: content, response: llmResponse.content)
+            memoryStore.learnFromInteraction(userMessage: content, response: llmResponse.content)
 
             // 10. Generate title if needed
             if conv.title == nil && conv.messages.count >= 2 {
@@ -118,13 +117,12 @@ class AgentCore: ObservableObject {
         conversation: Conversation,
         context: AssembledContext
     ) async throws -> ChatMessage {
-        // Save assistant message with tool calls
+        // Assistant message with tool calls
         let assistantMessage = ChatMessage(
             role: .assistant,
             content: response.content,
             toolCalls: toolCalls
         )
-        conversationStore.addMessage(assistantMessage, to: conversation)
 
         // Execute tools
         var toolResults: [ToolResult] = []
@@ -139,7 +137,9 @@ class AgentCore: ObservableObject {
             content: "",
             toolResults: toolResults
         )
-        conversationStore.addMessage(toolMessage, to: conversation)
+
+        // Save the call and its results together in one transaction
+        conversationStore.addMessages([assistantMessage, toolMessage], to: conversation)
 
         // Continue conversation with tool results
         return try await continueWithToolResults(conversation: conversation, context: context)
@@ -173,52 +173,31 @@ class AgentCore: ObservableObject {
 
     // MARK: - Helper Methods
 
-    private func determineTools(for context: AssembledContext) -> [AgentTool] {
-        var tools: [AgentTool] = []
-
-        // Always include basic tools
-        tools.append(.lookupContact)
-        tools.append(.searchMemory)
-        tools.append(.searchContext)
-        tools.append(.saveMemory)
-
-        // Always include people/CRM tools
-        tools.append(.searchPeople)
-        tools.append(.addPerson)
-        tools.append(.updatePerson)
-        tools.append(.addConnection)
-        tools.append(.getNetwork)
-
-        // Add scheduling tools if intent suggests it
-        if context.intent.type == .scheduleMeeting {
-            tools.append(.checkCalendar)
-            tools.append(.createCalendarEvent)
-        }
+    /// Basic and people/CRM tools, included on every request
+    private static let baseTools: [AgentTool] = [
+        .lookupContact, .searchMemory, .searchContext, .saveMemory,
+        .searchPeople, .addPerson, .updatePerson, .addConnection, .getNetwork
+    ]
 
-        // Add communication tools
-        if context.intent.type == .sendCommunication {
-            tools.append(.sendEmail)
-        }
+    private static let calendarTools: [AgentTool] = [.checkCalendar, .createCalendarEvent]
 
-        // Check for scheduling keywords
-        let schedulingKeywords = ["schedule", "calendar", "meeting", "appointment", "book", "reserve"]
-        if schedulingKeywords.contains(where: { context.userQuery.lowercased().contains($0) }) {
-            if !tools.contains(.checkCalendar) { tools.append(.checkCalendar) }
-            if !tools.contains(.createCalendarEvent) { tools.append(.createCalendarEvent) }
-        }
+    /// Complete tool list per intent, built once instead of appended per request
+    private static let toolsByIntent: [IntentType: [AgentTool]] = [
+        .scheduleMeeting: AgentCore.baseTools + AgentCore.calendarTools,
+        .sendCommunication: AgentCore.baseTools + [.sendEmail]
+    ]
 
-        return tools
+    private func determineTools(for context: AssembledContext) -> [AgentTool] {
+        // Any scheduling keyword already resolves the intent to .scheduleMeeting (the
+        // highest-priority rule), so calendar tools come from the intent table alone
+        return Self.toolsByIntent[context.intent.type] ?? Self.baseTools
     }
 
     private func getMessagesForAPI(conversation: Conversation) -> [ChatMessage] {
-        // Reload conversation to get latest messages
-        guard let fullConversation = conversationStore.loadConversation(id: conversation.id) else {
-            return []
-        }
-
-        // Limit to last N messages to avoid token limits
+        // Limit to last N messages to avoid token limits; the store keeps these cached
+        // as messages are saved, so a turn no longer reloads the whole conversation
         let maxMessages = 20
-        return Array(fullConversation.messages.suffix(maxMessages))
+        return conversationStore.recentMessages(forConversationId: conversation.id, limit: maxMessages)
     }
 
     private func generateTitle(for conversation: Conversation, firstMessage: String) {
@@ -7,19 +7,17 @@
 
 import Foundation
 
-class ContextAssembler {
+final class ContextAssembler {
 
     // MARK: - Main Assembly
 
     func assembleContext(
         for query: String,
-        conversation: Conversation,
         memoryStore: MemoryStore,
         contactsStore: ContactsStore
     ) async -> AssembledContext {
         // 1. Extract entities and intent
-        let entities = extractEntities(from: query)
-        let intent = inferIntent(from: query, entities: entities)
+        let (entities, intent) = parseQuery(query)
 
         // 2. Get relevant memories
         let relevantMemories = getRelevantMemories(
@@ -40,9 +38,6 @@ class ContextAssembler {
         // 5. Get clipboard context if relevant
         let clipboardContext: String? = intent.requiresClipboard ? getClipboardContext() : nil
 
-        // 6. Summarize conversation history
-        let conversationHistory = summarizeConversation(conversation)
-
         return AssembledContext(
             userQuery: query,
             intent: intent,
@@ -50,14 +45,90 @@ class ContextAssembler {
             contacts: relevantContacts,
             workContext: workContext,
             clipboardContext: clipboardContext,
-            conversationHistory: conversationHistory,
             timestamp: Date()
         )
     }
 
+    // MARK: - Query Parsing Cache
+
+    /// Entity extraction and intent inference depend only on the query text, so results
+    /// for recently seen queries (retries, repeated commands) are reused. The raw text is the
+    /// key: capitalization and spacing feed name detection, so they can't be normalized away.
+    private struct ParsedQuery {
+        let entities: ExtractedEntities
+        let intent: QueryIntent
+        var lastUsed: UInt64
+    }
+
+    private static let maxCachedQueries = 512
+
+    private var parsedQueries: [String: ParsedQuery] = [:]
+    private var parseClock: UInt64 = 0  // bumped on every cache touch; lowest lastUsed is evicted
+    private let parseCacheQueue = DispatchQueue(label: "com.solunified.contextassembler.parsecache")
+
+    func parseQuery(_ query: String) -> (entities: ExtractedEntities, intent: QueryIntent) {
+        if let cached = parseCacheQueue.sync(execute: { cachedParse(for: query) }) {
+            return (cached.entities, cached.intent)
+        }
+
+        // Lowercase once; entity extraction and intent inference both read it
+        let lowercaseQuery = query.lowercased()
+        let entities = extractEntities(from: query, lowercaseQuery: lowercaseQuery)
+        let intent = inferIntent(lowercaseQuery: lowercaseQuery, entities: entities)
+
+        parseCacheQueue.sync {
+            storeParse(entities: entities, intent: intent, for: query)
+        }
+        return (entities, intent)
+    }
+
+    /// A hit is a hash lookup and a recency bump; no recency list is scanned
+    private func cachedParse(for query: String) -> ParsedQuery? {
+        guard var parsed = parsedQueries[query] else { return nil }
+        parseClock += 1
+        parsed.lastUsed = parseClock
+        parsedQueries[query] = parsed
+        return parsed
+    }
+
+    private func storeParse(entities: ExtractedEntities, intent: QueryIntent, for query: String) {
+        parseClock += 1
+        parsedQueries[query] = ParsedQuery(entities: entities, intent: intent, lastUsed: parseClock)
+
+        // Only a miss on a full cache pays for the scan to find the least recently used entry
+        if parsedQueries.count > Self.maxCachedQueries,
+           let oldest = parsedQueries.min(by: { $0.value.lastUsed < $1.value.lastUsed })?.key {
+            parsedQueries.removeValue(forKey: oldest)
+        }
+    }
+
     // MARK: - Entity Extraction
 
+    private static let dateKeywords = [
+        "today", "tomorrow", "yesterday",
+        "monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday",
+        "next week", "this week", "next month",
+        "morning", "afternoon", "evening"
+    ]
+
+    /// All date keywords as one zero-width lookahead alternation, scanned once per query
+    private static let dateKeywordMatcher: NSRegularExpression? = {
+        let alternation = dateKeywords
+            .map { NSRegularExpression.escapedPattern(for: $0) }
+            .joined(separator: "|")
+        return try? NSRegularExpression(pattern: "(?=(\(alternation)))", options: [])
+    }()
+
+    private static let locationRegex = try? NSRegularExpression(
+        pattern: "\\b(?:at|in|near|around) (\\S+)",
+        options: [.caseInsensitive]
+    )
+
     func extractEntities(from query: String) -> ExtractedEntities {
+        return extractEntities(from: query, lowercaseQuery: query.lowercased())
+    }
+
+    private func extractEntities(from query: String, lowercaseQuery: String) -> ExtractedEntities {
         var keywords: [String] = []
         var names: [String] = []
         var dates: [String] = []
@@ -82,33 +153,31 @@ class ContextAssembler {
             }
 
             // Add as keyword if it's substantial
-            if cleanWord.count > 2 && !isStopWord(cleanWord) {
-                keywords.append(cleanWord.lowercased())
+            if cleanWord.count > 2 {
+                let lowercaseWord = cleanWord.lowercased()
+                if !isStopWord(lowercaseWord) {
+                    keywords.append(lowercaseWord)
+                }
             }
         }
 
         // Extract date references
-        let dateKeywords = [
-            "today", "tomorrow", "yesterday",
-            "monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday",
-            "next week", "this week", "next month",
-            "morning", "afternoon", "evening"
-        ]
-
-        let lowercaseQuery = query.lowercased()
-        for keyword in dateKeywords {
-            if lowercaseQuery.contains(keyword) {
-                dates.append(keyword)
+        if let matcher = Self.dateKeywordMatcher {
+            let nsQuery = lowercaseQuery as NSString
+            for match in matcher.matches(in: lowercaseQuery, options: [], range: NSRange(location: 0, length: nsQuery.length)) {
+                dates.append(nsQuery.substring(with: match.range(at: 1)))
             }
+        } else {
+            dates = Self.dateKeywords.filter { lowercaseQuery.contains($0) }
         }
 
-        // Extract location indicators
-        let locationPrepositions = ["at", "in", "near", "around"]
-        for prep in locationPrepositions {
-            if let range = lowercaseQuery.range(of: "\(prep) ") {
-                let afterPrep = String(query[range.upperBound...])
-                let potentialLocation = afterPrep.components(separatedBy: .whitespaces).first ?? ""
-                if !potentialLocation.isEmpty && potentialLocation.first?.isUppercase == true {
+        // Extract location indicators (capitalized word following a preposition)
+        if let regex = Self.locationRegex {
+            let range = NSRange(query.startIndex..., in: query)
+            for match in regex.matches(in: query, options: [], range: range) {
+                guard let locationRange = Range(match.range(at: 1), in: query) else { continue }
+                let potentialLocation = query[locationRange]
+                if potentialLocation.first?.isUppercase == true {
                     locations.append(potentialLocation.trimmingCharacters(in: .punctuationCharacters))
                 }
             }
@@ -124,61 +193,123 @@ class ContextAssembler {
 
     // MARK: - Intent Inference
 
-    func inferIntent(from query: String, entities: ExtractedEntities) -> QueryIntent {
-        let lowercaseQuery = query.lowercased()
+    /// Keyword rule for a single intent, checked in declaration order
+    private struct IntentRule {
+        let type: IntentType
+        let keywords: [String]
+        let requiresTools: Bool
+    }
 
-        // Scheduling intent
-        let schedulingKeywords = ["schedule", "book", "reserve", "meeting", "appointment", "calendar", "set up", "arrange"]
-        if schedulingKeywords.contains(where: { lowercaseQuery.contains($0) }) {
-            return QueryIntent(
-                type: .scheduleMeeting,
-                entities: entities,
-                requiresTools: true,
-                requiresClipboard: false
-            )
+    /// Built once; previously these keyword arrays were re-allocated on every query
+    private static let intentRules: [IntentRule] = [
+        IntentRule(
+            type: .scheduleMeeting,
+            keywords: ["schedule", "book", "reserve", "meeting", "appointment", "calendar", "set up", "arrange"],
+            requiresTools: true
+        ),
+        IntentRule(
+            type: .sendCommunication,
+            keywords: ["email", "send", "message", "write to", "contact", "reach out"],
+            requiresTools: true
+        ),
+        IntentRule(
+            type: .searchInformation,
+            keywords: ["find", "search", "look up", "what is", "who is", "where is"],
+            requiresTools: true
+        ),
+        IntentRule(
+            type: .createContent,
+            keywords: ["create", "write", "make", "build", "generate", "draft"],
+            requiresTools: false
+        ),
+        IntentRule(
+            type: .manageTask,
+            keywords: ["remind", "task", "todo", "add to list", "remember to"],
+            requiresTools: true
+        )
+    ]
+
+    /// Every intent keyword in one zero-width lookahead alternation, listed in rule order, so a
+    /// single scan reports each keyword hit (including overlapping ones) with its start position
+    private static let intentKeywordMatcher: NSRegularExpression? = {
+        let alternation = intentRules
+            .flatMap { $0.keywords }
+            .map { NSRegularExpression.escapedPattern(for: $0) }
+            .joined(separator: "|")
+        return try? NSRegularExpression(pattern: "(?=(\(alternation)))", options: [])
+    }()
+
+    private static let ruleIndexByKeyword: [String: Int] = {
+        var index: [String: Int] = [:]
+        for (ruleIndex, rule) in intentRules.enumerated() {
+            for keyword in rule.keywords where index[keyword] == nil {
+                index[keyword] = ruleIndex
+            }
         }
-
-        // Communication intent
-        let communicationKeywords = ["email", "send", "message", "write to", "contact", "reach out"]
-        if communicationKeywords.contains(where: { lowercaseQuery.contains($0) }) {
-            return QueryIntent(
-                type: .sendCommunication,
-                entities: entities,
-                requiresTools: true,
-                requiresClipboard: false
-            )
+        return index
+    }()
+
+    /// Rule for queries that are nothing but a keyword ("todo", "remind", "write to"), resolved
+    /// ahead of time with the same scan so the answer matches what the scan would return
+    private static let exactKeywordRuleIndex: [String: Int] = {
+        var index: [String: Int] = [:]
+        for keyword in intentRules.flatMap({ $0.keywords }) where index[keyword] == nil {
+            if let ruleIndex = matchingRuleIndex(in: keyword) {
+                index[keyword] = ruleIndex
+            }
+        }
+        return index
+    }()
+
+    /// Earliest-declared rule with any keyword in the text; bare keywords skip the regex scan
+    private func firstMatchingRule(in lowercaseQuery: String) -> IntentRule? {
+        let trimmed = lowercaseQuery.trimmingCharacters(in: .whitespacesAndNewlines)
+        if let ruleIndex = Self.exactKeywordRuleIndex[trimmed] {
+            return Self.intentRules[ruleIndex]
         }
+        return Self.matchingRuleIndex(in: lowercaseQuery).map { Self.intentRules[$0] }
+    }
 
-        // Search intent
-        let searchKeywords = ["find", "search", "look up", "what is", "who is", "where is"]
-        if searchKeywords.contains(where: { lowercaseQuery.contains($0) }) {
-            return QueryIntent(
-                type: .searchInformation,
-                entities: entities,
-                requiresTools: true,
-                requiresClipboard: false
-            )
+    /// Index of the earliest-declared rule with any keyword in the text, found in one pass over it
+    private static func matchingRuleIndex(in lowercaseQuery: String) -> Int? {
+        guard let matcher = intentKeywordMatcher else {
+            return intentRules.firstIndex { rule in
+                rule.keywords.contains(where: { lowercaseQuery.contains($0) })
+            }
         }
 
-        // Content creation intent
-        let createKeywords = ["create", "write", "make", "build", "generate", "draft"]
-        if createKeywords.contains(where: { lowercaseQuery.contains($0) }) {
-            return QueryIntent(
-                type: .createContent,
-                entities: entities,
-                requiresTools: false,
-                requiresClipboard: lowercaseQuery.contains("clipboard") || lowercaseQuery.contains("copied")
-            )
+        var bestIndex: Int?
+        let range = NSRange(lowercaseQuery.startIndex..., in: lowercaseQuery)
+        matcher.enumerateMatches(in: lowercaseQuery, options: [], range: range) { match, _, stop in
+            guard let match = match,
+                  let keywordRange = Range(match.range(at: 1), in: lowercaseQuery),
+                  let ruleIndex = ruleIndexByKeyword[String(lowercaseQuery[keywordRange])] else {
+                return
+            }
+            bestIndex = min(bestIndex ?? ruleIndex, ruleIndex)
+            if ruleIndex == 0 {
+                stop.pointee = true
+            }
         }
 
-        // Task management intent
-        let taskKeywords = ["remind", "task", "todo", "add to list", "remember to"]
-        if taskKeywords.contains(where: { lowercaseQuery.contains($0) }) {
+        return bestIndex
+    }
+
+    func inferIntent(from query: String, entities: ExtractedEntities) -> QueryIntent {
+        return inferIntent(lowercaseQuery: query.lowercased(), entities: entities)
+    }
+
+    private func inferIntent(lowercaseQuery: String, entities: ExtractedEntities) -> QueryIntent {
+        if let rule = firstMatchingRule(in: lowercaseQuery) {
+            // Content creation is the only intent that may pull in the clipboard
+            let requiresClipboard = rule.type == .createContent &&
+                (lowercaseQuery.contains("clipboard") || lowercaseQuery.contains("copied"))
+
             return QueryIntent(
-                type: .manageTask,
+                type: rule.type,
                 entities: entities,
-                requiresTools: true,
-                requiresClipboard: false
+                requiresTools: rule.requiresTools,
+                requiresClipboard: requiresClipboard
             )
         }
 
@@ -213,15 +344,11 @@ class ContextAssembler {
 
         // If no specific matches, get top memories by usage
         if memories.isEmpty {
-            memories = Array(memoryStore.memories
-                .sorted { $0.usageCount > $1.usageCount }
-                .prefix(5))
+            memories = memoryStore.mostUsedMemories(limit: 5)
         }
 
-        // Record usage for retrieved memories
-        for memory in memories {
-            memoryStore.recordUsage(memory.id)
-        }
+        // Record usage for retrieved memories in one batch
+        memoryStore.recordUsage(memories.map { $0.id })
 
         return memories
     }
@@ -232,25 +359,23 @@ class ContextAssembler {
         entities: ExtractedEntities,
         contactsStore: ContactsStore
     ) -> [Contact] {
+        // Most queries mention no names; skip the search and dedupe work entirely
+        guard !entities.names.isEmpty else { return [] }
+
         var contacts: [Contact] = []
+        var seen = Set<String>()
 
-        // Search by extracted names
+        // Search by extracted names, deduplicating as we go
         for name in entities.names {
-            let found = contactsStore.findContact(named: name)
-            contacts.append(contentsOf: found)
-        }
-
-        // Deduplicate
-        var seen = Set<String>()
-        contacts = contacts.filter { contact in
-            if seen.contains(contact.id) {
-                return false
+            for contact in contactsStore.findContact(named: name) where seen.insert(contact.id).inserted {
+                contacts.append(contact)
+                if contacts.count == 5 {  // Limit to 5 contacts
+                    return contacts
+                }
             }
-            seen.insert(contact.id)
-            return true
         }
 
-        return Array(contacts.prefix(5))  // Limit to 5 contacts
+        return contacts
     }
 
     // MARK: - Work Context
@@ -282,44 +407,30 @@ class ContextAssembler {
         return lines.joined(separator: "\n")
     }
 
-    // MARK: - Conversation Summary
-
-    private func summarizeConversation(_ conversation: Conversation) -> String? {
-        guard !conversation.messages.isEmpty else { return nil }
-
-        let recentMessages = conversation.messages.suffix(10)
-
-        var lines = ["Recent conversation:"]
-        for message in recentMessages {
-            let role = message.role == .user ? "User" : "Assistant"
-            let preview = message.content.prefix(100)
-            lines.append("\(role): \(preview)")
-        }
-
-        return lines.joined(separator: "\n")
-    }
-
     // MARK: - Helpers
 
+    private static let commonWords: Set<String> = ["I", "The", "A", "An", "It", "Is", "Are", "Was", "Were", "Be", "Been", "Being"]
+
     private func isCommonWord(_ word: String) -> Bool {
-        let common = ["I", "The", "A", "An", "It", "Is", "Are", "Was", "Were", "Be", "Been", "Being"]
-        return common.contains(word)
+        return Self.commonWords.contains(word)
     }
 
+    private static let stopWords: Set<String> = [
+        "the", "a", "an", "is", "are", "was", "were", "be", "been", "being",
+        "have", "has", "had", "do", "does", "did", "will", "would", "could",
+        "should", "may", "might", "must", "can", "to", "of", "in", "for",
+        "on", "with", "at", "by", "from", "as", "into", "through", "during",
+        "before", "after", "above", "below", "between", "under", "and", "but",
+        "or", "nor", "so", "yet", "both", "either", "neither", "not", "only",
+        "own", "same", "than", "too", "very", "just", "also", "now", "here",
+        "there", "when", "where", "why", "how", "all", "each", "every",
+        "few", "more", "most", "other", "some", "such", "no", "any", "this",
+        "that", "these", "those", "i", "me", "my", "we", "our", "you", "your",
+        "he", "him", "his", "she", "her", "it", "its", "they", "them", "their"
+    ]
+
+    /// Expects an already-lowercased word
     private func isStopWord(_ word: String) -> Bool {
-        let stopWords = [
-            "the", "a", "an", "is", "are", "was", "were", "be", "been", "being",
-            "have", "has", "had", "do", "does", "did", "will", "would", "could",
-            "should", "may", "might", "must", "can", "to", "of", "in", "for",
-            "on", "with", "at", "by", "from", "as", "into", "through", "during",
-            "before", "after", "above", "below", "between", "under", "and", "but",
-            "or", "nor", "so", "yet", "both", "either", "neither", "not", "only",
-            "own", "same", "than", "too", "very", "just", "also", "now", "here",
-            "there", "when", "where", "why", "how", "all", "each", "every", "both",
-            "few", "more", "most", "other", "some", "such", "no", "any", "this",
-            "that", "these", "those", "i", "me", "my", "we", "our", "you", "your",
-            "he", "him", "his", "she", "her", "it", "its", "they", "them", "their"
-        ]
-        return stopWords.contains(word.lowercased())
+        return Self.stopWords.contains(word)
     }
 }
@@ -8,14 +8,22 @@
 import Foundation
 import Combine
 
-class MemoryStore: ObservableObject {
+final class MemoryStore: ObservableObject {
     static let shared = MemoryStore()
 
-    @Published var memories: [Memory] = []
+    /// Ordered by usage count, then last update, both descending (load query and write-through cache keep it so)
+    @Published var memories: [Memory] = [] {
+        didSet { rebuildIndexes() }
+    }
     @Published var isLoading = false
 
     private let db = Database.shared
 
+    // Lookup indexes over `memories`, rebuilt whenever it changes
+    private var memoriesById: [String: Memory] = [:]
+    private var memoriesByKey: [String: Memory] = [:]
+    private var memorySearchText: [String: String] = [:]  // id -> lowercased "key value"
+
     private init() {
         loadMemories()
         seedDefaultMemories()
@@ -54,7 +62,11 @@ class MemoryStore: ObservableObject {
         ])
 
         if success {
-            loadMemories()
+            applyToCache { cached in
+                // INSERT OR REPLACE also evicts any row sharing the (category, key) unique index
+                cached.removeAll { $0.id == memory.id || ($0.category == memory.category && $0.key == memory.key) }
+                cached.append(memory)
+            }
         }
         return success
     }
@@ -65,7 +77,9 @@ class MemoryStore: ObservableObject {
     func deleteMemory(id: String) -> Bool {
         let success = db.execute("DELETE FROM memories WHERE id = ?", parameters: [id])
         if success {
-            loadMemories()
+            applyToCache { cached in
+                cached.removeAll { $0.id == id }
+            }
         }
         return success
     }
@@ -73,45 +87,75 @@ class MemoryStore: ObservableObject {
     // MARK: - Query
 
     func query(_ query: MemoryQuery) -> [Memory] {
-        var filtered = memories
+        // Lowercase the keywords once rather than once per memory
+        let keywords = query.keywords.map { $0.lowercased() }
+        let searchText = memorySearchText
 
-        if let category = query.category {
-            filtered = filtered.filter { $0.category == category }
-        }
+        // Single pass over the memories, stopping as soon as the limit is reached
+        var results: [Memory] = []
+        for memory in memories {
+            guard results.count < query.limit else { break }
 
-        if !query.keywords.isEmpty {
-            filtered = filtered.filter { memory in
-                query.keywords.contains { keyword in
-                    memory.key.localizedCaseInsensitiveContains(keyword) ||
-                    memory.value.localizedCaseInsensitiveContains(keyword)
-                }
+            if let category = query.category, memory.category != category { continue }
+            if memory.confidence < query.minConfidence { continue }
+
+            if !keywords.isEmpty {
+                guard let text = searchText[memory.id],
+                      keywords.contains(where: { text.contains($0) }) else { continue }
             }
-        }
 
-        filtered = filtered.filter { $0.confidence >= query.minConfidence }
+            results.append(memory)
+        }
 
-        return Array(filtered.prefix(query.limit))
+        return results
     }
 
     func getMemory(category: MemoryCategory, key: String) -> Memory? {
-        return memories.first { $0.category == category && $0.key == key }
+        return memoriesByKey[Self.indexKey(category, key)]
     }
 
     func getMemoriesByCategory(_ category: MemoryCategory) -> [Memory] {
         return memories.filter { $0.category == category }
     }
 
+    /// Most-used memories first; `memories` is already in that order, so no sort is needed
+    func mostUsedMemories(limit: Int) -> [Memory] {
+        return Array(memories.prefix(limit))
+    }
+
     // MARK: - Usage Tracking
 
     func recordUsage(_ memoryId: String) {
-        guard var memory = memories.first(where: { $0.id == memoryId }) else { return }
+        guard var memory = memoriesById[memoryId] else { return }
         memory.usageCount += 1
         memory.updatedAt = Date()
         _ = saveMemory(memory)
     }
 
+    /// Records usage for several memories with one UPDATE
+    func recordUsage(_ memoryIds: [String]) {
+        guard !memoryIds.isEmpty else { return }
+
+        let now = Date()
+        let placeholders = Array(repeating: "?", count: memoryIds.count).joined(separator: ", ")
+        let success = db.execute(
+            "UPDATE memories SET usage_count = usage_count + 1, updated_at = ? WHERE id IN (\(placeholders))",
+            parameters: [Database.dateToString(now)] + memoryIds
+        )
+
+        if success {
+            let ids = Set(memoryIds)
+            applyToCache { cached in
+                for index in cached.indices where ids.contains(cached[index].id) {
+                    cached[index].usageCount += 1
+                    cached[index].updatedAt = now
+                }
+            }
+        }
+    }
+
     func confirmMemory(_ memoryId: String) {
-        guard var memory = memories.first(where: { $0.id == memoryId }) else { return }
+        guard var memory = memoriesById[memoryId] else { return }
         memory.lastConfirmed = Date()
         memory.confidence = min(1.0, memory.confidence + 0.1)
         memory.updatedAt = Date()
@@ -169,64 +213,80 @@ class MemoryStore: ObservableObject {
         }
     }
 
-    func learnFromInteraction(userMessage: String, response: String) async {
+    /// Phrase detector for automatic memory creation; the learned value is whatever
+    /// follows one of the trigger phrases on the same line
+    private struct FactPattern {
+        let category: MemoryCategory
+        let keyPrefix: String
+        let confidence: Double
+        let phrases: String  // regex alternation of trigger phrases
+    }
+
+    private static let factPatterns: [FactPattern] = [
+        FactPattern(
+            category: .userPreference,
+            keyPrefix: "user_stated_preference",
+            confidence: 0.9,
+            phrases: "i prefer|i like"
+        ),
+        FactPattern(
+            category: .routine,
+            keyPrefix: "user_stated_routine",
+            confidence: 0.85,
+            phrases: "i usually|i always"
+        ),
+        FactPattern(
+            category: .workContext,
+            keyPrefix: "work_info",
+            confidence: 0.9,
+            phrases: "i work|my job"
+        )
+    ]
+
+    /// All fact patterns as zero-width lookahead branches, pattern i capturing its value in group
+    /// i + 1, so a single scan finds each pattern's first match even where their phrases overlap
+    private static let factMatcher: NSRegularExpression? = {
+        let branches = factPatterns.map { "(?=(?:\($0.phrases)) (.+))" }
+        return try? NSRegularExpression(pattern: branches.joined(separator: "|"), options: [.caseInsensitive])
+    }()
+
+    func learnFromInteraction(userMessage: String, response: String) {
         // Pattern detection for automatic memory creation
         // This is a simple implementation - could be enhanced with NLP
 
-        let lowercaseMessage = userMessage.lowercased()
-
-        // Detect preferences
-        if lowercaseMessage.contains("i prefer") || lowercaseMessage.contains("i like") {
-            // Extract what they prefer (simple heuristic)
-            if let range = lowercaseMessage.range(of: "i prefer ") ?? lowercaseMessage.range(of: "i like ") {
-                let preference = String(userMessage[range.upperBound...])
-                    .trimmingCharacters(in: .punctuationCharacters)
-                    .trimmingCharacters(in: .whitespaces)
-                if !preference.isEmpty && preference.count < 100 {
-                    learnFact(
-                        category: .userPreference,
-                        key: "user_stated_preference_\(Date().timeIntervalSince1970)",
-                        value: preference,
-                        source: .userStated,
-                        confidence: 0.9
-                    )
+        guard let matcher = Self.factMatcher else { return }
+        let range = NSRange(userMessage.startIndex..., in: userMessage)
+
+        // First match of each pattern, found in one pass over the message
+        var matchedValues = [String?](repeating: nil, count: Self.factPatterns.count)
+        var unmatchedCount = matchedValues.count
+        matcher.enumerateMatches(in: userMessage, options: [], range: range) { match, _, stop in
+            guard let match = match else { return }
+            for index in matchedValues.indices where matchedValues[index] == nil {
+                if let valueRange = Range(match.range(at: index + 1), in: userMessage) {
+                    matchedValues[index] = String(userMessage[valueRange])
+                    unmatchedCount -= 1
                 }
             }
-        }
-
-        // Detect routines
-        if lowercaseMessage.contains("i usually") || lowercaseMessage.contains("i always") {
-            if let range = lowercaseMessage.range(of: "i usually ") ?? lowercaseMessage.range(of: "i always ") {
-                let routine = String(userMessage[range.upperBound...])
-                    .trimmingCharacters(in: .punctuationCharacters)
-                    .trimmingCharacters(in: .whitespaces)
-                if !routine.isEmpty && routine.count < 100 {
-                    learnFact(
-                        category: .routine,
-                        key: "user_stated_routine_\(Date().timeIntervalSince1970)",
-                        value: routine,
-                        source: .userStated,
-                        confidence: 0.85
-                    )
-                }
+            if unmatchedCount == 0 {
+                stop.pointee = true
             }
         }
 
-        // Detect work context
-        if lowercaseMessage.contains("i work") || lowercaseMessage.contains("my job") {
-            if let range = lowercaseMessage.range(of: "i work ") ?? lowercaseMessage.range(of: "my job ") {
-                let workInfo = String(userMessage[range.upperBound...])
-                    .trimmingCharacters(in: .punctuationCharacters)
-                    .trimmingCharacters(in: .whitespaces)
-                if !workInfo.isEmpty && workInfo.count < 100 {
-                    learnFact(
-                        category: .workContext,
-                        key: "work_info_\(Date().timeIntervalSince1970)",
-                        value: workInfo,
-                        source: .userStated,
-                        confidence: 0.9
-                    )
-                }
+        for (pattern, matchedValue) in zip(Self.factPatterns, matchedValues) {
+            guard let matchedValue = matchedValue else { continue }
+
+            let value = matchedValue
+                .trimmingCharacters(in: .punctuationCharacters)
+                .trimmingCharacters(in: .whitespaces)
+            if !value.isEmpty && value.count < 100 {
+                learnFact(
+                    category: pattern.category,
+                    key: "\(pattern.keyPrefix)_\(Date().timeIntervalSince1970)",
+                    value: value,
+                    source: .userStated,
+                    confidence: pattern.confidence
+                )
             }
         }
     }
@@ -260,9 +320,7 @@ class MemoryStore: ObservableObject {
     // MARK: - Export for Agent Context
 
     func getContextSummary(limit: Int = 10) -> String {
-        let topMemories = memories
-            .sorted { $0.usageCount > $1.usageCount }
-            .prefix(limit)
+        let topMemories = mostUsedMemories(limit: limit)
 
         if topMemories.isEmpty {
             return "No memories stored yet."
@@ -276,6 +334,38 @@ class MemoryStore: ObservableObject {
         return lines.joined(separator: "\n")
     }
 
+    // MARK: - Write-Through Cache
+
+    /// Mirrors a successful write into `memories` (kept in load order) instead of re-reading the table
+    private func applyToCache(_ update: @escaping (inout [Memory]) -> Void) {
+        DispatchQueue.main.async { [weak self] in
+            guard let self = self else { return }
+            var cached = self.memories
+            update(&cached)
+            cached.sort { ($0.usageCount, $0.updatedAt) > ($1.usageCount, $1.updatedAt) }
+            self.memories = cached
+        }
+    }
+
+    // MARK: - Indexes
+
+    private static func indexKey(_ category: MemoryCategory, _ key: String) -> String {
+        return "\(category.rawValue):\(key)"
+    }
+
+    private func rebuildIndexes() {
+        // Keep the first occurrence to match the previous first(where:) semantics
+        memoriesById = Dictionary(memories.map { ($0.id, $0) }, uniquingKeysWith: { first, _ in first })
+        memoriesByKey = Dictionary(
+            memories.map { (Self.indexKey($0.category, $0.key), $0) },
+            uniquingKeysWith: { first, _ in first }
+        )
+        memorySearchText = Dictionary(
+            memories.map { ($0.id, "\($0.key)\n\($0.value)".lowercased()) },
+            uniquingKeysWith: { first, _ in first }
+        )
+    }
+
     // MARK: - Row Parsing
 
     private func memoryFromRow(_ row: [String: Any]) -> Memory? {
@@ -19,8 +19,8 @@ struct AgentStatus: Codable, Identifiable {
     init(from decoder: Decoder) throws {
         let container = try decoder.container(keyedBy: CodingKeys.self)
         self.last_active = try container.decodeIfPresent(String.self, forKey: .last_active)
-        self.current_focus = try container.decode(String.self, forKey: .current_focus)
-        self.status = try container.decode(String.self, forKey: .status)
+        self.current_focus = try container.decodeIfPresent(String.self, forKey: .current_focus) ?? ""
+        self.status = try container.decodeIfPresent(String.self, forKey: .status) ?? "offline"
         // name is derived from the dictionary key, set externally
         self.name = ""
     }
@@ -76,7 +76,17 @@ class AgentContextStore: ObservableObject {
     private var stateMonitor: DispatchSourceFileSystemObject?
     private var messagesMonitor: DispatchSourceFileSystemObject?
     
+    /// Modification date + size of a file as of its last successful parse
+    private struct FileStamp: Equatable {
+        let modified: Date
+        let size: UInt64
+    }
+    
+    private var stateStamp: FileStamp?
+    private var messagesStamp: FileStamp?
+    
     private let memoryTracker = MemoryTracker.shared
+    private static let decoder = JSONDecoder()
     
     init() {
         loadData()
@@ -88,8 +98,8 @@ class AgentContextStore: ObservableObject {
     }
     
     func loadData() {
-        agentState = loadState()
-        messages = loadMessages()
+        reloadStateIfChanged()
+        reloadMessagesIfChanged()
         lastUpdated = Date()
         print("🔄 Agent data loaded at \(lastUpdated)")
     }
@@ -107,6 +117,36 @@ class AgentContextStore: ObservableObject {
         memoryTracker.updateContextFile()
     }
     
+    // MARK: - Change Detection
+    
+    // Re-reading and re-parsing is skipped when the file's mtime and size are unchanged
+    // since the last load (repeated write events, forceSync with nothing new)
+    private func reloadStateIfChanged() {
+        let stamp = fileStamp(atPath: statePath)
+        if let stamp = stamp, stamp == stateStamp { return }
+        agentState = loadState()
+        stateStamp = agentState == nil ? nil : stamp
+    }
+    
+    private func reloadMessagesIfChanged() {
+        let stamp = fileStamp(atPath: messagesPath)
+        if let stamp = stamp, stamp == messagesStamp { return }
+        let (loaded, isComplete) = loadMessages()
+        messages = loaded
+        // A failed or partial read (e.g. a line still being written) must be retried on the
+        // next event, so the stamp is only kept when every line parsed
+        messagesStamp = isComplete ? stamp : nil
+    }
+    
+    private func fileStamp(atPath path: String) -> FileStamp? {
+        guard let attributes = try? FileManager.default.attributesOfItem(atPath: path),
+              let modified = attributes[.modificationDate] as? Date,
+              let size = attributes[.size] as? NSNumber else {
+            return nil
+        }
+        return FileStamp(modified: modified, size: size.uint64Value)
+    }
+    
     private func loadState() -> AgentState? {
         guard let data = FileManager.default.contents(atPath: statePath) else {
             print("⚠️ Could not read agent_state.json")
@@ -114,34 +154,23 @@ class AgentContextStore: ObservableObject {
         }
         
         do {
-            // Parse manually to inject agent names
-            let json = try JSONSerialization.jsonObject(with: data) as? [String: Any]
-            guard let json = json,
-                  let version = json["version"] as? String,
-                  let lastUpdated = json["last_updated"] as? String,
-                  let systemStatus = json["system_status"] as? String,
-                  let activeAgentsDict = json["active_agents"] as? [String: [String: Any]] else {
-                return nil
-            }
-            
-            var agents: [String: AgentStatus] = [:]
-            for (name, agentData) in activeAgentsDict {
-                let lastActive = agentData["last_active"] as? String
-                let currentFocus = agentData["current_focus"] as? String ?? ""
-                let status = agentData["status"] as? String ?? "offline"
-                
-                agents[name] = AgentStatus(
+            // Decode only the keys AgentState declares; the rest of the file (tasks etc.) is skipped
+            let decoded = try Self.decoder.decode(AgentState.self, from: data)
+
+            // Agent names come from the dictionary keys
+            let agents = Dictionary(uniqueKeysWithValues: decoded.active_agents.map { name, agent in
+                (name, AgentStatus(
                     name: name,
-                    last_active: lastActive,
-                    current_focus: currentFocus,
-                    status: status
-                )
-            }
-            
+                    last_active: agent.last_active,
+                    current_focus: agent.current_focus,
+                    status: agent.status
+                ))
+            })
+
             return AgentState(
-                version: version,
-                last_updated: lastUpdated,
-                system_status: systemStatus,
+                version: decoded.version,
+                last_updated: decoded.last_updated,
+                system_status: decoded.system_status,
                 active_agents: agents
             )
         } catch {
@@ -150,43 +179,48 @@ class AgentContextStore: ObservableObject {
         }
     }
     
-    private func loadMessages() -> [AgentMessage] {
+    private func loadMessages() -> (messages: [AgentMessage], isComplete: Bool) {
         guard let content = try? String(contentsOfFile: messagesPath, encoding: .utf8) else {
             print("⚠️ Could not read agent_messages.log")
-            return []
+            return ([], false)
         }
         
         let lines = content.components(separatedBy: .newlines)
             .filter { !$0.trimmingCharacters(in: .whitespacesAndNewlines).isEmpty }
         
         var parsedMessages: [AgentMessage] = []
+        var isComplete = true
         
         for line in lines {
-            guard let data = line.data(using: .utf8) else { continue }
+            guard let data = line.data(using: .utf8) else {
+                isComplete = false
+                continue
+            }
             
             do {
-                let message = try JSONDecoder().decode(AgentMessage.self, from: data)
+                let message = try Self.decoder.decode(AgentMessage.self, from: data)
                 parsedMessages.append(message)
             } catch {
                 print("⚠️ Could not parse message line: \(error)")
+                isComplete = false
             }
         }
         
         // Return in reverse chronological order (newest first)
-        return parsedMessages.reversed()
+        return (Array(parsedMessages.reversed()), isComplete)
     }
     
     private func startMonitoring() {
         monitorFile(path: statePath) { [weak self] in
             DispatchQueue.main.async {
-                self?.agentState = self?.loadState()
+                self?.reloadStateIfChanged()
                 self?.lastUpdated = Date()
             }
         }
         
         monitorFile(path: messagesPath) { [weak self] in
             DispatchQueue.main.async {
-                self?.messages = self?.loadMessages() ?? []
+                self?.reloadMessagesIfChanged()
                 self?.lastUpdated = Date()
             }
         }
@@ -149,6 +149,12 @@ class CalendarStore: ObservableObject {
         }
     }
 
+    /// Calendars from the shared event store, sorted by title
+    func availableCalendars() -> [EKCalendar] {
+        eventStore.refreshSourcesIfNecessary()
+        return eventStore.calendars(for: .event).sorted { $0.title < $1.title }
+    }
+
     func getEvents(for date: Date, forceRefresh: Bool = false) async -> [CalendarEvent] {
         let key = cacheKey(for: date)
 
@@ -173,6 +179,7 @@ class CalendarStore: ObservableObject {
         let startOfDay = calendar.startOfDay(for: date)
         let endOfDay = calendar.date(byAdding: .day, value: 1, to: startOfDay) ?? date
 
+        #if DEBUG
         // Debug: List all available calendars
         let allCalendars = eventStore.calendars(for: .event)
         print("📅 Available calendars (\(allCalendars.count)):")
@@ -186,6 +193,7 @@ class CalendarStore: ObservableObject {
         for source in sources {
             print("   - \(source.title) (type: \(source.sourceType.rawValue))")
         }
+        #endif
 
         print("📅 Fetching events from \(startOfDay) to \(endOfDay)")
 
@@ -237,16 +245,25 @@ class CalendarStore: ObservableObject {
     func getUpcomingExternalMeetings(days: Int = 7) async -> [CalendarEvent] {
         guard hasAccess else { return [] }
 
-        var allEvents: [CalendarEvent] = []
         let calendar = Calendar.current
+        let now = Date()
+        let dates = (0..<days).compactMap { calendar.date(byAdding: .day, value: $0, to: now) }
+
+        // Fetch days concurrently so each day's source-sync wait overlaps
+        let eventsByDay = await withTaskGroup(of: (Int, [CalendarEvent]).self) { group in
+            for (index, date) in dates.enumerated() {
+                group.addTask {
+                    (index, await self.getEvents(for: date))
+                }
+            }
 
-        for dayOffset in 0..<days {
-            if let date = calendar.date(byAdding: .day, value: dayOffset, to: Date()) {
-                let events = await getEvents(for: date)
-                allEvents.append(contentsOf: events.filter { $0.isExternal })
+            var results = [[CalendarEvent]](repeating: [], count: dates.count)
+            for await (index, events) in group {
+                results[index] = events
             }
+            return results
         }
 
-        return allEvents
+        return eventsByDay.flatMap { $0.filter { $0.isExternal } }
     }
 }
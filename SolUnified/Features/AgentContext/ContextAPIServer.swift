@@ -144,12 +144,12 @@ class ContextAPIServer: ObservableObject {
         // Parse HTTP request
         let lines = request.split(separator: "\r\n")
         guard let firstLine = lines.first else {
-            return httpResponse(status: 400, body: ["error": "Invalid request"])
+            return Self.invalidRequestResponse
         }
         
         let parts = firstLine.split(separator: " ")
         guard parts.count >= 2 else {
-            return httpResponse(status: 400, body: ["error": "Invalid request"])
+            return Self.invalidRequestResponse
         }
         
         let method = String(parts[0])
@@ -180,47 +180,56 @@ class ContextAPIServer: ObservableObject {
         }
 
         guard method == "GET" else {
-            return httpResponse(status: 405, body: ["error": "Method not allowed"])
+            return Self.methodNotAllowedResponse
         }
 
-        switch path {
-        case "/", "/context":
-            return handleContextRequest()
-        case "/clipboard":
+        guard let route = Self.getRoutes[path] else {
+            return httpResponse(status: 404, body: ["error": "Not found", "path": path])
+        }
+        return route(self, query)
+    }
+
+    private typealias GetHandler = (ContextAPIServer, [String: String]) -> String
+
+    /// GET routes keyed by path, built once and looked up per request
+    private static let getRoutes: [String: GetHandler] = [
+        "/": { server, _ in server.handleContextRequest() },
+        "/context": { server, _ in server.handleContextRequest() },
+        "/clipboard": { server, query in
             let limit = Int(query["limit"] ?? "10") ?? 10
-            let app = query["app"]
-            return handleClipboardRequest(limit: limit, app: app)
-        case "/activity":
+            return server.handleClipboardRequest(limit: limit, app: query["app"])
+        },
+        "/activity": { server, query in
             let hours = Int(query["hours"] ?? "4") ?? 4
-            return handleActivityRequest(hours: hours)
-        case "/contexts":
+            return server.handleActivityRequest(hours: hours)
+        },
+        "/contexts": { server, query in
             let hours = Int(query["hours"] ?? "24") ?? 24
-            return handleContextsRequest(hours: hours)
-        case "/search":
+            return server.handleContextsRequest(hours: hours)
+        },
+        "/search": { server, query in
             guard let q = query["q"], !q.isEmpty else {
-                return httpResponse(status: 400, body: ["error": "Missing query parameter 'q'"])
-            }
-            return handleSearchRequest(query: q)
-        case "/stats":
-            return handleStatsRequest()
-        case "/health":
-            return handleHealthRequest()
-        case "/calendar/events":
-            let dateStr = query["date"] ?? ISO8601DateFormatter().string(from: Date())
-            return handleCalendarEventsRequest(date: dateStr)
-        case "/people/search":
+                return ContextAPIServer.missingQueryResponse
+            }
+            return server.handleSearchRequest(query: q)
+        },
+        "/stats": { server, _ in server.handleStatsRequest() },
+        "/health": { server, _ in server.handleHealthRequest() },
+        "/calendar/events": { server, query in
+            let dateStr = query["date"] ?? Database.dateToString(Date())
+            return server.handleCalendarEventsRequest(date: dateStr)
+        },
+        "/people/search": { server, query in
             guard let q = query["q"], !q.isEmpty else {
-                return httpResponse(status: 400, body: ["error": "Missing query parameter 'q'"])
+                return ContextAPIServer.missingQueryResponse
             }
             let fuzzy = query["fuzzy"] != "false"
-            return handlePeopleSearchRequest(query: q, fuzzy: fuzzy)
-        case "/agent/actions":
-            let status = query["status"]
-            return handleGetActionsRequest(status: status)
-        default:
-            return httpResponse(status: 404, body: ["error": "Not found", "path": path])
+            return server.handlePeopleSearchRequest(query: q, fuzzy: fuzzy)
+        },
+        "/agent/actions": { server, query in
+            server.handleGetActionsRequest(status: query["status"])
         }
-    }
+    ]
     
     private func parseQueryString(_ query: String) -> [String: String] {
         var result: [String: String] = [:]
@@ -441,7 +450,7 @@ class ContextAPIServer: ObservableObject {
         let avgFocus = focusResults.first?["avg"] as? Double ?? 0
         
         return httpResponse(status: 200, body: [
-            "date": ISO8601DateFormatter().string(from: today),
+            "date": Database.dateToString(today),
             "clipboard_items": clipboardCount,
             "activity_events": activityCount,
             "context_sessions": contextCount,
@@ -462,7 +471,7 @@ class ContextAPIServer: ObservableObject {
     private func handleCalendarEventsRequest(date: String) -> String {
         // Parse the date parameter
         let targetDate: Date
-        if let parsed = ISO8601DateFormatter().date(from: date) {
+        if let parsed = Database.stringToDate(date) {
             targetDate = parsed
         } else {
             // Try simple date format
@@ -643,15 +652,19 @@ class ContextAPIServer: ObservableObject {
 
     // MARK: - POST Request Handler
 
+    private typealias BodyHandler = (ContextAPIServer, String) -> String
+
+    /// POST routes keyed by path, built once alongside `getRoutes`
+    private static let postRoutes: [String: BodyHandler] = [
+        "/agent/actions": { server, body in server.handleCreateAction(body: body) },
+        "/people": { server, body in server.handleCreatePerson(body: body) }
+    ]
+
     private func handlePostRequest(path: String, body: String) -> String {
-        switch path {
-        case "/agent/actions":
-            return handleCreateAction(body: body)
-        case "/people":
-            return handleCreatePerson(body: body)
-        default:
+        guard let route = Self.postRoutes[path] else {
             return httpResponse(status: 404, body: ["error": "POST endpoint not found", "path": path])
         }
+        return route(self, body)
     }
 
     // MARK: - PUT Request Handler
@@ -669,7 +682,7 @@ class ContextAPIServer: ObservableObject {
 
     private func handleCreateAction(body: String) -> String {
         guard let data = body.data(using: .utf8) else {
-            return httpResponse(status: 400, body: ["error": "Invalid request body"])
+            return Self.invalidBodyResponse
         }
 
         // Expected JSON structure:
@@ -686,7 +699,7 @@ class ContextAPIServer: ObservableObject {
 
         do {
             guard let json = try JSONSerialization.jsonObject(with: data) as? [String: Any] else {
-                return httpResponse(status: 400, body: ["error": "Invalid JSON"])
+                return Self.invalidJSONResponse
             }
 
             guard let typeStr = json["type"] as? String,
@@ -727,7 +740,7 @@ class ContextAPIServer: ObservableObject {
 
     private func handleCreatePerson(body: String) -> String {
         guard let data = body.data(using: .utf8) else {
-            return httpResponse(status: 400, body: ["error": "Invalid request body"])
+            return Self.invalidBodyResponse
         }
 
         // Expected JSON structure:
@@ -745,7 +758,7 @@ class ContextAPIServer: ObservableObject {
 
         do {
             guard let json = try JSONSerialization.jsonObject(with: data) as? [String: Any] else {
-                return httpResponse(status: 400, body: ["error": "Invalid JSON"])
+                return Self.invalidJSONResponse
             }
 
             guard let name = json["name"] as? String, !name.isEmpty else {
@@ -797,7 +810,7 @@ class ContextAPIServer: ObservableObject {
 
     private func handleUpdatePerson(id: String, body: String) -> String {
         guard let data = body.data(using: .utf8) else {
-            return httpResponse(status: 400, body: ["error": "Invalid request body"])
+            return Self.invalidBodyResponse
         }
 
         // Expected JSON structure (all fields optional, only provided fields are updated):
@@ -815,7 +828,7 @@ class ContextAPIServer: ObservableObject {
 
         do {
             guard let json = try JSONSerialization.jsonObject(with: data) as? [String: Any] else {
-                return httpResponse(status: 400, body: ["error": "Invalid JSON"])
+                return Self.invalidJSONResponse
             }
 
             // Find existing person using semaphore
@@ -896,7 +909,18 @@ class ContextAPIServer: ObservableObject {
 
     // MARK: - Helpers
     
+    /// Fixed error responses, serialized once rather than on every failed request
+    private static let invalidRequestResponse = makeHTTPResponse(status: 400, body: ["error": "Invalid request"])
+    private static let methodNotAllowedResponse = makeHTTPResponse(status: 405, body: ["error": "Method not allowed"])
+    private static let missingQueryResponse = makeHTTPResponse(status: 400, body: ["error": "Missing query parameter 'q'"])
+    private static let invalidBodyResponse = makeHTTPResponse(status: 400, body: ["error": "Invalid request body"])
+    private static let invalidJSONResponse = makeHTTPResponse(status: 400, body: ["error": "Invalid JSON"])
+
     private func httpResponse(status: Int, body: [String: Any]) -> String {
+        return Self.makeHTTPResponse(status: status, body: body)
+    }
+
+    private static func makeHTTPResponse(status: Int, body: [String: Any]) -> String {
         let statusText: String
         switch status {
         case 200: statusText = "OK"
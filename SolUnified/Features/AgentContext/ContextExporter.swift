@@ -114,6 +114,13 @@ class ContextExporter: ObservableObject {
         return f
     }()
 
+    // Configured once; the export runs every 30 seconds
+    private let encoder: JSONEncoder = {
+        let e = JSONEncoder()
+        e.outputFormatting = [.prettyPrinted, .sortedKeys]
+        return e
+    }()
+
     private init() {
         // Create export directory in Documents for easy access
         let documentsURL = FileManager.default.urls(for: .documentDirectory, in: .userDomainMask).first!
@@ -217,8 +224,6 @@ class ContextExporter: ObservableObject {
 
         // Export JSON
         do {
-            let encoder = JSONEncoder()
-            encoder.outputFormatting = [.prettyPrinted, .sortedKeys]
             let jsonData = try encoder.encode(context)
             try jsonData.write(to: mainExportPath, options: .atomic)
         } catch {
@@ -239,7 +239,7 @@ class MemoryTracker: ObservableObject {
     private func hashString(_ input: String) -> String {
         let data = Data(input.utf8)
         let digest = SHA256.hash(data: data)
-        return digest.compactMap { String(format: "%02x", $0) }.joined()
+        return digest.hexString
     }
     
     // MARK: - Intelligence Extraction
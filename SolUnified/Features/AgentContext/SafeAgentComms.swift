@@ -29,7 +29,7 @@ struct SafeMessage: Codable {
         let combined = "\(id):\(content):\(timestamp)"
         let data = Data(combined.utf8)
         let digest = SHA256.hash(data: data)
-        return digest.compactMap { String(format: "%02x", $0) }.joined()
+        return digest.hexString
     }
     
     var isValid: Bool {
@@ -82,6 +82,13 @@ class SafeAgentComms {
         return documentsPath.appendingPathComponent("sol-context/.message_lock").path
     }
     
+    private let encoder: JSONEncoder = {
+        let e = JSONEncoder()
+        e.outputFormatting = .prettyPrinted
+        return e
+    }()
+    private let decoder = JSONDecoder()
+    
     private init() {}
     
     func sendMessage(from: String, to: String, content: String) -> Bool {
@@ -134,7 +141,7 @@ class SafeAgentComms {
     private func loadQueue() -> MessageQueue {
         guard FileManager.default.fileExists(atPath: queuePath),
               let data = FileManager.default.contents(atPath: queuePath),
-              let queue = try? JSONDecoder().decode(MessageQueue.self, from: data) else {
+              let queue = try? decoder.decode(MessageQueue.self, from: data) else {
             return MessageQueue()
         }
         
@@ -150,8 +157,6 @@ class SafeAgentComms {
     }
     
     private func saveQueue(_ queue: MessageQueue) throws {
-        let encoder = JSONEncoder()
-        encoder.outputFormatting = .prettyPrinted
         let data = try encoder.encode(queue)
         try data.write(to: URL(fileURLWithPath: queuePath))
     }
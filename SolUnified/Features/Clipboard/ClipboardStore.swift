@@ -83,6 +83,21 @@ class ClipboardStore: ObservableObject {
         return results.map { itemFromRow($0) }
     }
     
+    /// Runs the search off the main thread and delivers results on it
+    func searchHistory(query: String, completion: @escaping ([ClipboardItem]) -> Void) {
+        if query.isEmpty {
+            completion(items)
+            return
+        }
+        
+        DispatchQueue.global(qos: .userInitiated).async { [weak self] in
+            let results = self?.searchHistory(query: query) ?? []
+            DispatchQueue.main.async {
+                completion(results)
+            }
+        }
+    }
+    
     func copyToPasteboard(_ item: ClipboardItem) -> Bool {
         let pasteboard = NSPasteboard.general
         pasteboard.clearContents()
@@ -148,7 +163,7 @@ class ClipboardStore: ObservableObject {
     static func hashContent(_ content: String) -> String {
         let data = Data(content.utf8)
         let digest = SHA256.hash(data: data)
-        return digest.compactMap { String(format: "%02x", $0) }.joined()
+        return digest.hexString
     }
 }
 
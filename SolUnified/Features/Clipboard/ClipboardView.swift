@@ -13,12 +13,11 @@ struct ClipboardView: View {
     @State private var searchQuery = ""
     @State private var copiedItemId: Int?
     @State private var selectedItem: ClipboardItem?
+    @State private var searchResults: [ClipboardItem] = []
     
+    // Search results are fetched off the main thread, not queried on every render
     var filteredItems: [ClipboardItem] {
-        if searchQuery.isEmpty {
-            return store.items
-        }
-        return store.searchHistory(query: searchQuery)
+        searchQuery.isEmpty ? store.items : searchResults
     }
     
     var body: some View {
@@ -61,6 +60,7 @@ struct ClipboardView: View {
                             if !newValue.isEmpty {
                                 InternalAppTracker.shared.trackClipboardSearch(query: newValue)
                             }
+                            runSearch(newValue)
                         }
                 }
                 .padding(.horizontal, 10)
@@ -148,10 +148,27 @@ struct ClipboardView: View {
             // Refresh history when view appears
             store.loadHistory()
         }
+        .onReceive(store.$items) { _ in
+            // New copies should show up in an active search too
+            runSearch(searchQuery)
+        }
         .sheet(item: $selectedItem) { item in
             ClipboardItemDetailView(item: item)
         }
     }
+    
+    private func runSearch(_ query: String) {
+        guard !query.isEmpty else {
+            searchResults = []
+            return
+        }
+        store.searchHistory(query: query) { results in
+            // Drop results for a query that has since been typed past
+            if query == searchQuery {
+                searchResults = results
+            }
+        }
+    }
 }
 
 struct ClipboardItemCard: View {
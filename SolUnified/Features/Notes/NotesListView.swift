@@ -12,12 +12,11 @@ struct NotesListView: View {
     @State private var searchQuery = ""
     @State private var showingNewNote = false
     @State private var editingNote: Note?
+    @State private var searchResults: [Note] = []
     
+    // Search results are fetched off the main thread, not queried on every render
     var filteredNotes: [Note] {
-        if searchQuery.isEmpty {
-            return store.notes
-        }
-        return store.searchNotes(query: searchQuery)
+        searchQuery.isEmpty ? store.notes : searchResults
     }
     
     var body: some View {
@@ -49,6 +48,7 @@ struct NotesListView: View {
                         if !newValue.isEmpty {
                             InternalAppTracker.shared.trackNoteSearch(query: newValue)
                         }
+                        runSearch(newValue)
                     }
             }
             .padding(Spacing.lg)
@@ -102,6 +102,23 @@ struct NotesListView: View {
         .onAppear {
             store.loadAllNotes()
         }
+        .onReceive(store.$notes) { _ in
+            // Edits and deletes should show up in an active search too
+            runSearch(searchQuery)
+        }
+    }
+    
+    private func runSearch(_ query: String) {
+        guard !query.isEmpty else {
+            searchResults = []
+            return
+        }
+        store.searchNotes(query: query) { results in
+            // Drop results for a query that has since been typed past
+            if query == searchQuery {
+                searchResults = results
+            }
+        }
     }
 }
 
@@ -131,6 +131,21 @@ class NotesStore: ObservableObject {
         return results.map { noteFromRow($0) }
     }
     
+    /// Runs the search off the main thread and delivers results on it
+    func searchNotes(query: String, completion: @escaping ([Note]) -> Void) {
+        if query.isEmpty {
+            completion(notes)
+            return
+        }
+        
+        DispatchQueue.global(qos: .userInitiated).async { [weak self] in
+            let results = self?.searchNotes(query: query) ?? []
+            DispatchQueue.main.async {
+                completion(results)
+            }
+        }
+    }
+    
     // MARK: - Helper
     private func noteFromRow(_ row: [String: Any]) -> Note {
         Note(
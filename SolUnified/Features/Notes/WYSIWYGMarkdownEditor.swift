@@ -145,6 +145,16 @@ struct MarkdownTextEditor: NSViewRepresentable {
     @Binding var text: String
     let fontSize: CGFloat
     
+    /// Matches H1-H6 in a single scan; group 1 is the hash run, group 2 the title
+    private static let headerRegex = try? NSRegularExpression(pattern: "^(#{1,6}) (.+)$", options: [.anchorsMatchLines])
+    
+    // Inline patterns, compiled once instead of on every formatting pass
+    private static let boldRegex = try? NSRegularExpression(pattern: "\\*\\*(.+?)\\*\\*", options: [])
+    private static let italicRegex = try? NSRegularExpression(pattern: "(?<!\\*)\\*(?!\\*)(.+?)(?<!\\*)\\*(?!\\*)", options: [])
+    private static let inlineCodeRegex = try? NSRegularExpression(pattern: "`([^`]+)`", options: [])
+    private static let linkRegex = try? NSRegularExpression(pattern: "\\[([^\\]]+)\\]\\(([^)]+)\\)", options: [])
+    private static let listItemRegex = try? NSRegularExpression(pattern: "^([-*+]) (.+)$", options: [.anchorsMatchLines])
+    
     func makeNSView(context: Context) -> NSScrollView {
         let scrollView = NSScrollView()
         scrollView.drawsBackground = true
@@ -239,48 +249,44 @@ struct MarkdownTextEditor: NSViewRepresentable {
         textStorage.removeAttribute(.backgroundColor, range: fullRange)
         
         // Headers - make # symbols grey and de-emphasized
-        // Sizes are relative to base font size
-        let headerPatterns: [(String, CGFloat, CGFloat)] = [
-            ("^(#{1}) (.+)$", baseFontSize + 13, 700),  // H1
-            ("^(#{2}) (.+)$", baseFontSize + 9, 700),   // H2
-            ("^(#{3}) (.+)$", baseFontSize + 5, 600),   // H3
-            ("^(#{4}) (.+)$", baseFontSize + 2, 600),   // H4
-            ("^(#{5}) (.+)$", baseFontSize, 600),       // H5
-            ("^(#{6}) (.+)$", baseFontSize, 500)        // H6
+        // Sizes are relative to base font size, indexed by header level - 1
+        let headerStyles: [(CGFloat, CGFloat)] = [
+            (baseFontSize + 13, 700),  // H1
+            (baseFontSize + 9, 700),   // H2
+            (baseFontSize + 5, 600),   // H3
+            (baseFontSize + 2, 600),   // H4
+            (baseFontSize, 600),       // H5
+            (baseFontSize, 500)        // H6
         ]
         
-        for (pattern, fontSize, weight) in headerPatterns {
-            if let regex = try? NSRegularExpression(pattern: pattern, options: [.anchorsMatchLines]) {
-                let matches = regex.matches(in: textStorage.string, range: fullRange)
-                for match in matches {
-                    // Hide hashes if not editing this line (P1 feedback)
-                    let lineRange = (textStorage.string as NSString).lineRange(for: match.range)
-                    let isEditingLine = NSLocationInRange(selectedRange.location, lineRange)
-                    
-                    if match.numberOfRanges > 1 {
-                        let hashRange = match.range(at: 1)
-                        let hashColor = isEditingLine ? NSColor.tertiaryLabelColor : NSColor.clear
-                        
-                        textStorage.addAttributes([
-                            .foregroundColor: hashColor,
-                            .font: NSFont.systemFont(ofSize: 13, weight: .regular)
-                        ], range: hashRange)
-                    }
-                    
-                    // Make the header text large and bold
-                    if match.numberOfRanges > 2 {
-                        let textRange = match.range(at: 2)
-                        textStorage.addAttributes([
-                            .font: NSFont.systemFont(ofSize: fontSize, weight: .init(rawValue: weight)),
-                            .foregroundColor: NSColor.labelColor
-                        ], range: textRange)
-                    }
-                }
+        // One pass over the text for all six levels; the hash run length picks the style
+        if let regex = Self.headerRegex {
+            let matches = regex.matches(in: textStorage.string, range: fullRange)
+            for match in matches {
+                // Hide hashes if not editing this line (P1 feedback)
+                let lineRange = (textStorage.string as NSString).lineRange(for: match.range)
+                let isEditingLine = NSLocationInRange(selectedRange.location, lineRange)
+                
+                let hashRange = match.range(at: 1)
+                let hashColor = isEditingLine ? NSColor.tertiaryLabelColor : NSColor.clear
+                
+                textStorage.addAttributes([
+                    .foregroundColor: hashColor,
+                    .font: NSFont.systemFont(ofSize: 13, weight: .regular)
+                ], range: hashRange)
+                
+                // Make the header text large and bold
+                let (fontSize, weight) = headerStyles[hashRange.length - 1]
+                let textRange = match.range(at: 2)
+                textStorage.addAttributes([
+                    .font: NSFont.systemFont(ofSize: fontSize, weight: .init(rawValue: weight)),
+                    .foregroundColor: NSColor.labelColor
+                ], range: textRange)
             }
         }
         
         // Bold - grey out ** and make text bold
-        if let regex = try? NSRegularExpression(pattern: "\\*\\*(.+?)\\*\\*", options: []) {
+        if let regex = Self.boldRegex {
             let matches = regex.matches(in: textStorage.string, range: fullRange)
             for match in matches {
                 // Grey out the ** markers
@@ -302,7 +308,7 @@ struct MarkdownTextEditor: NSViewRepresentable {
         }
         
         // Italic - grey out * and make text italic
-        if let regex = try? NSRegularExpression(pattern: "(?<!\\*)\\*(?!\\*)(.+?)(?<!\\*)\\*(?!\\*)", options: []) {
+        if let regex = Self.italicRegex {
             let matches = regex.matches(in: textStorage.string, range: fullRange)
             for match in matches {
                 // Grey out the * markers
@@ -325,7 +331,7 @@ struct MarkdownTextEditor: NSViewRepresentable {
         }
         
         // Inline code - grey out backticks and add background
-        if let regex = try? NSRegularExpression(pattern: "`([^`]+)`", options: []) {
+        if let regex = Self.inlineCodeRegex {
             let matches = regex.matches(in: textStorage.string, range: fullRange)
             for match in matches {
                 // Grey out backticks
@@ -348,7 +354,7 @@ struct MarkdownTextEditor: NSViewRepresentable {
         }
         
         // Links - show link text prominently, grey out markdown syntax
-        if let regex = try? NSRegularExpression(pattern: "\\[([^\\]]+)\\]\\(([^)]+)\\)", options: []) {
+        if let regex = Self.linkRegex {
             let matches = regex.matches(in: textStorage.string, range: fullRange)
             for match in matches {
                 // Grey out [ ] ( ) markers
@@ -380,7 +386,7 @@ struct MarkdownTextEditor: NSViewRepresentable {
         }
         
         // List items - keep dash visible but with proper spacing
-        if let regex = try? NSRegularExpression(pattern: "^([-*+]) (.+)$", options: [.anchorsMatchLines]) {
+        if let regex = Self.listItemRegex {
             let matches = regex.matches(in: textStorage.string, range: fullRange)
             for match in matches {
                 if match.numberOfRanges > 1 {
@@ -11,7 +11,9 @@ import Combine
 class PeopleStore: ObservableObject {
     static let shared = PeopleStore()
 
-    @Published var people: [Person] = []
+    @Published var people: [Person] = [] {
+        didSet { rebuildPeopleIndexes() }
+    }
     @Published var organizations: [Organization] = []
     @Published var events: [NetworkEvent] = []
     @Published var allTags: [String] = []
@@ -19,6 +21,10 @@ class PeopleStore: ObservableObject {
 
     private let db = Database.shared
 
+    // Lookup indexes over `people`, rebuilt whenever it changes
+    private var peopleById: [String: Person] = [:]
+    private var peopleByName: [String: Person] = [:]  // lowercased name -> person
+
     private init() {
         loadAll()
     }
@@ -98,11 +104,17 @@ class PeopleStore: ObservableObject {
     }
 
     func getPerson(id: String) -> Person? {
-        people.first { $0.id == id }
+        peopleById[id]
     }
 
     func getPersonByName(_ name: String) -> Person? {
-        people.first { $0.name.lowercased() == name.lowercased() }
+        peopleByName[name.lowercased()]
+    }
+
+    private func rebuildPeopleIndexes() {
+        // Keep the first occurrence to match the previous first(where:) semantics
+        peopleById = Dictionary(people.map { ($0.id, $0) }, uniquingKeysWith: { first, _ in first })
+        peopleByName = Dictionary(people.map { ($0.name.lowercased(), $0) }, uniquingKeysWith: { first, _ in first })
     }
 
     // MARK: - Organizations CRUD
@@ -52,15 +52,82 @@ class ScreenshotAnalyzer: ObservableObject {
         let lowerText = recognizedText.lowercased()
         
         // Context detection heuristics
-        if lowerText.contains("order confirmed") || lowerText.contains("receipt") || lowerText.contains("total:") { tags.append("Purchase") }
-        if lowerText.contains("sent") && (lowerText.contains("message") || lowerText.contains("email")) { tags.append("Communication") }
-        if lowerText.contains("build succeeded") || lowerText.contains("commit") || lowerText.contains("pr merged") { tags.append("Dev") }
-        if lowerText.contains("error") || lowerText.contains("failed") || lowerText.contains("exception") { tags.append("Error") }
-        if lowerText.contains("slack") || lowerText.contains("discord") || lowerText.contains("whatsapp") { tags.append("Social") }
+        let found = keywordMask(in: lowerText)
+        for rule in Self.tagRuleMasks where found & rule.allMask == rule.allMask && found & rule.anyMask != 0 {
+            tags.append(rule.tag)
+        }
         
         let description = "Local OCR Analysis (\(recognizedText.count) chars)"
 
         return (description, tags.joined(separator: ", "), recognizedText)
     }
-}
 
+    // MARK: - Tag Heuristics
+
+    private struct TagRule {
+        let tag: String
+        let anyOf: [String]
+        var allOf: [String] = []
+    }
+
+    /// A rule with its keywords folded into bitmasks, so checking it is two mask tests
+    private struct TagRuleMask {
+        let tag: String
+        let anyMask: UInt64
+        let allMask: UInt64
+    }
+
+    private static let tagRules: [TagRule] = [
+        TagRule(tag: "Purchase", anyOf: ["order confirmed", "receipt", "total:"]),
+        TagRule(tag: "Communication", anyOf: ["message", "email"], allOf: ["sent"]),
+        TagRule(tag: "Dev", anyOf: ["build succeeded", "commit", "pr merged"]),
+        TagRule(tag: "Error", anyOf: ["error", "failed", "exception"]),
+        TagRule(tag: "Social", anyOf: ["slack", "discord", "whatsapp"])
+    ]
+
+    /// Distinct keywords in rule order; a keyword's position is its bit
+    private static let tagKeywords: [String] = {
+        var seen = Set<String>()
+        return tagRules.flatMap { $0.allOf + $0.anyOf }.filter { seen.insert($0).inserted }
+    }()
+
+    private static let keywordBits: [String: UInt64] = Dictionary(
+        uniqueKeysWithValues: tagKeywords.enumerated().map { ($0.element, UInt64(1) << UInt64($0.offset)) }
+    )
+
+    private static let allKeywordsMask: UInt64 = mask(for: tagKeywords)
+
+    private static let tagRuleMasks: [TagRuleMask] = tagRules.map {
+        TagRuleMask(tag: $0.tag, anyMask: mask(for: $0.anyOf), allMask: mask(for: $0.allOf))
+    }
+
+    private static func mask(for keywords: [String]) -> UInt64 {
+        return keywords.reduce(0) { $0 | (keywordBits[$1] ?? 0) }
+    }
+
+    /// Every tag keyword in one zero-width lookahead alternation, so a single scan over the
+    /// OCR text reports each keyword present instead of one substring search per keyword
+    private static let tagKeywordMatcher: NSRegularExpression? = {
+        let alternation = tagKeywords
+            .map { NSRegularExpression.escapedPattern(for: $0) }
+            .joined(separator: "|")
+        return try? NSRegularExpression(pattern: "(?=(\(alternation)))", options: [])
+    }()
+
+    private func keywordMask(in lowerText: String) -> UInt64 {
+        guard let matcher = Self.tagKeywordMatcher else {
+            return Self.mask(for: Self.tagKeywords.filter { lowerText.contains($0) })
+        }
+
+        var found: UInt64 = 0
+        let nsText = lowerText as NSString
+        matcher.enumerateMatches(in: lowerText, range: NSRange(location: 0, length: nsText.length)) { match, _, stop in
+            guard let range = match?.range(at: 1), range.location != NSNotFound else { return }
+            found |= Self.keywordBits[nsText.substring(with: range)] ?? 0
+            if found == Self.allKeywordsMask {
+                stop.pointee = true
+            }
+        }
+        return found
+    }
+}
@@ -30,6 +30,7 @@ class ScreenshotScanner: ObservableObject {
     // When a screenshot appears, we capture what app was active just before
     private var recentAppContext: (bundleId: String?, appName: String?, windowTitle: String?) = (nil, nil, nil)
     private var contextUpdateTimer: Timer?
+    private static let screenshotApps: Set<String> = ["com.apple.screencaptureui", "com.apple.screenshot", "com.apple.screencapture"]
     
     private init() {
         startContextTracking()
@@ -48,8 +49,7 @@ class ScreenshotScanner: ObservableObject {
             let bundleId = currentApp?.bundleIdentifier ?? ""
             
             // Skip system screenshot utilities
-            let screenshotApps = ["com.apple.screencaptureui", "com.apple.screenshot", "com.apple.screencapture"]
-            if screenshotApps.contains(bundleId) {
+            if Self.screenshotApps.contains(bundleId) {
                 return
             }
             
@@ -358,7 +358,7 @@ class ScreenshotScanner: ObservableObject {
     private func getFileHash(filePath: String) throws -> String {
         let fileData = try Data(contentsOf: URL(fileURLWithPath: filePath))
         let hash = SHA256.hash(data: fileData)
-        return hash.compactMap { String(format: "%02x", $0) }.joined()
+        return hash.hexString
     }
     
     private func getImageDimensions(filePath: String) -> (Int?, Int?) {
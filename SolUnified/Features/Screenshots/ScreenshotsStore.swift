@@ -14,6 +14,7 @@ class ScreenshotsStore: ObservableObject {
     @Published var stats: ScreenshotStats?
     
     private let db = Database.shared
+    private var loadGeneration = 0  // main thread only; bumped per load so stale results are dropped
     
     private init() {}
     
@@ -21,7 +22,11 @@ class ScreenshotsStore: ObservableObject {
         var sql = "SELECT * FROM screenshots"
         var parameters: [Any] = []
         
-        if let search = search, !search.isEmpty {
+        // Trigram phrases need at least three characters; shorter terms fall back to LIKE
+        if let search = search, search.unicodeScalars.count >= 3, db.hasScreenshotSearchIndex {
+            sql += " WHERE id IN (SELECT rowid FROM screenshots_fts WHERE screenshots_fts MATCH ?)"
+            parameters = [Database.ftsPhrase(search)]
+        } else if let search = search, !search.isEmpty {
             sql += """
                  WHERE ai_description LIKE ? 
                     OR ai_tags LIKE ? 
@@ -40,15 +45,29 @@ class ScreenshotsStore: ObservableObject {
         print("🔍 Loading screenshots: \(sql)")
         print("   Parameters: \(parameters)")
         
-        let results = db.query(sql, parameters: parameters)
-        print("📸 Loaded \(results.count) screenshots from database")
+        // Query off the main thread; search reloads on every keystroke
+        loadGeneration += 1
+        let generation = loadGeneration
+        let finalSQL = sql
+        let finalParameters = parameters
         
-        screenshots = results.map { screenshotFromRow($0) }
-        print("✅ Converted to \(screenshots.count) Screenshot objects")
-        
-        // Debug: Print first screenshot if available
-        if let first = screenshots.first {
-            print("   First screenshot: \(first.filename) at \(first.filepath)")
+        DispatchQueue.global(qos: .userInitiated).async { [weak self] in
+            guard let self = self else { return }
+            let results = self.db.query(finalSQL, parameters: finalParameters)
+            let loaded = results.map { self.screenshotFromRow($0) }
+            
+            DispatchQueue.main.async {
+                // A newer load has started since; its results win
+                guard generation == self.loadGeneration else { return }
+                
+                self.screenshots = loaded
+                print("📸 Loaded \(loaded.count) screenshots from database")
+                
+                // Debug: Print first screenshot if available
+                if let first = loaded.first {
+                    print("   First screenshot: \(first.filename) at \(first.filepath)")
+                }
+            }
         }
     }
     
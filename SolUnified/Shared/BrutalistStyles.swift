@@ -27,41 +27,54 @@ struct VisualEffectView: NSViewRepresentable {
 }
 
 // MARK: - Colors
+// Parsed once; the color accessors only pick the variant for the current mode
+private enum BrutalistPalette {
+    static let bgPrimary = (dark: Color(hex: "#050505"), light: Color(hex: "#fafafa"))
+    static let bgSecondary = (dark: Color(hex: "#0D0D0D"), light: Color(hex: "#ffffff"))
+    static let bgTertiary = (dark: Color(hex: "#1A1A1A"), light: Color(hex: "#f4f4f5"))
+    static let textPrimary = (dark: Color(hex: "#FFFFFF"), light: Color(hex: "#18181b"))
+    static let textSecondary = (dark: Color(hex: "#8E8E93"), light: Color(hex: "#52525b"))
+    static let textMuted = (dark: Color(hex: "#48484A"), light: Color(hex: "#a1a1aa"))
+    static let border = (dark: Color(hex: "#1C1C1E"), light: Color(hex: "#e4e4e7"))
+    static let accent = (dark: Color(hex: "#0A84FF"), light: Color(hex: "#3b82f6"))
+    static let accentHover = (dark: Color(hex: "#409CFF"), light: Color(hex: "#2563eb"))
+}
+
 extension Color {
     static var brutalistBgPrimary: Color {
-        AppSettings.shared.isDarkMode ? Color(hex: "#050505") : Color(hex: "#fafafa")
+        AppSettings.shared.isDarkMode ? BrutalistPalette.bgPrimary.dark : BrutalistPalette.bgPrimary.light
     }
     
     static var brutalistBgSecondary: Color {
-        AppSettings.shared.isDarkMode ? Color(hex: "#0D0D0D") : Color(hex: "#ffffff")
+        AppSettings.shared.isDarkMode ? BrutalistPalette.bgSecondary.dark : BrutalistPalette.bgSecondary.light
     }
     
     static var brutalistBgTertiary: Color {
-        AppSettings.shared.isDarkMode ? Color(hex: "#1A1A1A") : Color(hex: "#f4f4f5")
+        AppSettings.shared.isDarkMode ? BrutalistPalette.bgTertiary.dark : BrutalistPalette.bgTertiary.light
     }
     
     static var brutalistTextPrimary: Color {
-        AppSettings.shared.isDarkMode ? Color(hex: "#FFFFFF") : Color(hex: "#18181b")
+        AppSettings.shared.isDarkMode ? BrutalistPalette.textPrimary.dark : BrutalistPalette.textPrimary.light
     }
     
     static var brutalistTextSecondary: Color {
-        AppSettings.shared.isDarkMode ? Color(hex: "#8E8E93") : Color(hex: "#52525b")
+        AppSettings.shared.isDarkMode ? BrutalistPalette.textSecondary.dark : BrutalistPalette.textSecondary.light
     }
     
     static var brutalistTextMuted: Color {
-        AppSettings.shared.isDarkMode ? Color(hex: "#48484A") : Color(hex: "#a1a1aa")
+        AppSettings.shared.isDarkMode ? BrutalistPalette.textMuted.dark : BrutalistPalette.textMuted.light
     }
     
     static var brutalistBorder: Color {
-        AppSettings.shared.isDarkMode ? Color(hex: "#1C1C1E") : Color(hex: "#e4e4e7")
+        AppSettings.shared.isDarkMode ? BrutalistPalette.border.dark : BrutalistPalette.border.light
     }
     
     static var brutalistAccent: Color {
-        AppSettings.shared.isDarkMode ? Color(hex: "#0A84FF") : Color(hex: "#3b82f6")
+        AppSettings.shared.isDarkMode ? BrutalistPalette.accent.dark : BrutalistPalette.accent.light
     }
     
     static var brutalistAccentHover: Color {
-        AppSettings.shared.isDarkMode ? Color(hex: "#409CFF") : Color(hex: "#2563eb")
+        AppSettings.shared.isDarkMode ? BrutalistPalette.accentHover.dark : BrutalistPalette.accentHover.light
     }
     
     init(hex: String) {
@@ -0,0 +1,25 @@
+//
+//  HexEncoding.swift
+//  SolUnified
+//
+//  Hex encoding for digests (content hashes, file hashes, checksums)
+//
+
+import Foundation
+
+private let hexDigits = Array("0123456789abcdef".utf8)
+
+// Qualified: the app's own `Sequence` model shadows the standard library protocol
+extension Swift.Sequence where Element == UInt8 {
+    /// Lowercase hex, as stored for content and file hashes; a table lookup per nibble
+    /// instead of a String(format:) call per byte
+    var hexString: String {
+        var encoded: [UInt8] = []
+        encoded.reserveCapacity(underestimatedCount * 2)
+        for byte in self {
+            encoded.append(hexDigits[Int(byte >> 4)])
+            encoded.append(hexDigits[Int(byte & 0x0F)])
+        }
+        return String(decoding: encoded, as: UTF8.self)
+    }
+}
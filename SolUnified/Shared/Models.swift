@@ -118,7 +118,7 @@ struct ScreenshotStats: Codable {
 }
 
 // MARK: - Activity Models
-enum ActivityEventType: String, Codable {
+enum ActivityEventType: String, Codable, CaseIterable {
     case appLaunch
     case appTerminate
     case appActivate
@@ -176,6 +176,11 @@ enum ActivityEventType: String, Codable {
     case reflectionLog
     case mindfulnessSessionStart
     case mindfulnessSessionEnd
+    
+    /// Hashed raw-value lookup for bulk row parsing; init(rawValue:) compares against each case in turn
+    static let byRawValue: [String: ActivityEventType] = Dictionary(
+        uniqueKeysWithValues: allCases.map { ($0.rawValue, $0) }
+    )
 }
 
 struct ActivityEvent: Identifiable, Codable {
@@ -1183,7 +1188,6 @@ struct AssembledContext {
     let contacts: [Contact]
     let workContext: String?
     let clipboardContext: String?
-    let conversationHistory: String?
     let timestamp: Date
 }
 
@@ -10,7 +10,7 @@ import SwiftUI
 import AppKit
 import EventKit
 
-class AppSettings: ObservableObject {
+final class AppSettings: ObservableObject {
     static let shared = AppSettings()
     
     @Published var windowWidthPercent: CGFloat {
@@ -963,10 +963,9 @@ struct CalendarListView: View {
         }
     }
 
+    @MainActor
     private func loadCalendars() {
-        let eventStore = EKEventStore()
-        eventStore.refreshSourcesIfNecessary()
-        calendars = eventStore.calendars(for: .event).sorted { $0.title < $1.title }
+        calendars = CalendarStore.shared.availableCalendars()
     }
 }
 
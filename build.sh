@@ -17,14 +17,16 @@ APP_BUNDLE="$BUILD_DIR/$APP_NAME.app"
 CONTENTS_DIR="$APP_BUNDLE/Contents"
 MACOS_DIR="$CONTENTS_DIR/MacOS"
 RESOURCES_DIR="$CONTENTS_DIR/Resources"
+# debug for fast local iteration; package.sh builds release (optimized)
+CONFIGURATION="${CONFIGURATION:-debug}"
 
 # Clean previous build
 echo "🧹 Cleaning previous build..."
 rm -rf "$APP_BUNDLE"
 
-# Build the Swift executable (debug mode for faster builds)
-echo "⚙️  Building Swift executable..."
-swift build
+# Build the Swift executable
+echo "⚙️  Building Swift executable ($CONFIGURATION)..."
+swift build -c "$CONFIGURATION"
 
 # Create .app bundle structure
 echo "📦 Creating .app bundle..."
@@ -33,7 +35,7 @@ mkdir -p "$RESOURCES_DIR"
 
 # Copy the executable
 echo "📋 Copying executable..."
-cp ".build/debug/SolUnified" "$MACOS_DIR/$APP_NAME"
+cp ".build/$CONFIGURATION/SolUnified" "$MACOS_DIR/$APP_NAME"
 chmod +x "$MACOS_DIR/$APP_NAME"
 
 # Create Info.plist
@@ -10,8 +10,8 @@ echo ""
 echo "════════════════════════════════════════"
 echo ""
 
-# Step 1: Build the app
-./build.sh
+# Step 1: Build the app (optimized for distribution)
+CONFIGURATION=release ./build.sh
 
 echo ""
 echo "════════════════════════════════════════"